@@ -18,7 +18,7 @@ from ._logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class StreamItem(ABC):
     """
     Represents an item of data streaming through the pipeline.
@@ -26,6 +26,9 @@ class StreamItem(ABC):
     The `StreamItem` contains essential properties, such as its sequence ID and
     associated resource name, enabling it to hold metadata and stream data.
 
+    Stream items are created for every line/record flowing through a pipeline, so they
+    are declared with `slots=True` to avoid carrying a per-instance `__dict__`.
+
     Attributes:
         sequence_id (int): Sequential identifier for the data (e.g., line #, row #, page #).
         resource_name (str): Name of the data source (e.g., file name, table, or sheet name).
@@ -125,8 +128,13 @@ class InputBase(ABC):
     Base class for all input components in the pipeline.
 
     Input components are responsible for streaming data into the pipeline.
+
+    The built-in inputs declare `__slots__`; the empty slots here keep the base class from
+    adding a per-instance `__dict__` back.  Subclasses that don't declare slots get one as usual.
     """
 
+    __slots__ = ()
+
     def _list_or_string(self, items: list[str] | str | None, sep: str = " ") -> list[str]:
         """
         Converts the input into a list of strings.
@@ -197,6 +205,15 @@ class InputBase(ABC):
         """
         return list(self.stream())
 
+    def __iter__(self):
+        """
+        Iterate over the streamed data, so `for item in input_:` works directly.
+
+        Returns:
+            Iterator[StreamItem]: The generator returned by `stream`.
+        """
+        return iter(self.stream())
+
     def __or__(self, other):
         """
         Overloads the '|' operator for Inputs to support chaining in pipelines.
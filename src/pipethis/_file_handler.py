@@ -22,6 +22,8 @@ Example Usage:
             print(f"{item.sequence_id}: {item.data}")
     ```
 """
+import codecs
+import mmap
 import pathlib
 
 from ._base import FileHandlerBase
@@ -36,26 +38,83 @@ class TextFileHandler(FileHandlerBase):
     """
     Handles streaming text files line by line.
     Supports context management to open and close file resources.
+
+    Large UTF-8 (or ASCII) files are memory mapped and split on line endings directly in
+    the mapped bytes, which avoids copying every line through the text I/O layer.  Small
+    files are read and decoded in a single unbuffered read and then split.  All paths
+    produce the same lines: `\n`, `\r\n` and `\r` all end a line.
     """
 
-    def __init__(self, file_path: pathlib.Path, encoding='utf-8'):
+    # Files larger than this are memory mapped when `use_mmap` is left as None
+    MMAP_THRESHOLD = 16 * 1024 * 1024
+
+    # Files up to this size are read whole rather than streamed through a text file object
+    SMALL_FILE_THRESHOLD = 64 * 1024
+
+    # Encodings whose encoded line endings can't appear inside a multibyte character
+    _MMAP_ENCODINGS = ("utf-8", "ascii")
+
+    def __init__(self, file_path: pathlib.Path, encoding='utf-8', use_mmap: bool | None = None):
+        """
+        Initialize the handler.
+
+        Args:
+            file_path (pathlib.Path): Path to the text file.
+            encoding (str): Text encoding of the file. Defaults to 'utf-8'.
+            use_mmap (bool | None): Force (True) or disable (False) memory mapping. The
+                default (None) maps files larger than `MMAP_THRESHOLD` if the encoding is
+                UTF-8 or ASCII.
+        """
 
         # Delay import yuck, to prevent circular imports.
         super().__init__(file_path)
         self._file = None  # Internal file resource
+        self._mmap = None  # Memory map of `_file` when the mmap path is used
+        self._read_whole = False  # True when `_file` is a raw file to be read in one go
+        self._streamed = False  # True once `stream` has started in the current context
         self.encoding = encoding
+        self.use_mmap = use_mmap
+
+    def _should_mmap(self, size: int) -> bool:
+        """
+        Decide whether a file of `size` bytes should be memory mapped.
+        """
+        if self.use_mmap is False:
+            return False
+        if codecs.lookup(self.encoding).name not in self._MMAP_ENCODINGS:
+            if self.use_mmap:
+                msg = f"Memory mapping requires a UTF-8 or ASCII encoding, not '{self.encoding}'."
+                raise ValueError(msg)
+            return False
+        return bool(self.use_mmap) or size > self.MMAP_THRESHOLD
 
     def __enter__(self):
         """
         Open the file for reading.
         """
-        self._file = self.file_path.open('r', encoding=self.encoding)
+        size = self.file_path.stat().st_size
+        self._read_whole = False
+        self._streamed = False
+        if self._should_mmap(size):
+            self._file = self.file_path.open('rb')
+            # Empty files can't be mapped; they simply stream nothing.
+            if size:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        elif size <= self.SMALL_FILE_THRESHOLD:
+            # One read call is all that's needed, so skip the buffered and text layers.
+            self._file = self.file_path.open('rb', buffering=0)
+            self._read_whole = True
+        else:
+            self._file = self.file_path.open('r', encoding=self.encoding)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         """
         Close the file.
         """
+        if self._mmap:
+            self._mmap.close()
+            self._mmap = None
         if self._file:
             self._file.close()
             self._file = None
@@ -63,12 +122,73 @@ class TextFileHandler(FileHandlerBase):
     def stream(self):
         """
         Stream lines from the opened file as LineStreamItems.
+
+        The file is streamed once per context: calling `stream` again in the same context
+        yields nothing, whichever way the file is being read.  Re-enter to stream it again.
         """
         if not self._file:
             msg = "The file is not open. You must use this file_handler in a context manager."
             raise RuntimeError(msg)
 
+        if self._streamed:
+            return
+        self._streamed = True
+
+        if self._read_whole:
+            yield from self._stream_whole()
+            return
+
+        if 'b' in self._file.mode:
+            yield from self._stream_mmap()
+            return
+
+        resource_name = str(self.file_path)
         for sequence_id, line in enumerate(self._file, start=1):
             line = line.replace('\r\n', '\n').replace('\r', '\n').replace('\n', '')
 
-            yield LineStreamItem(sequence_id, str(self.file_path), line)
+            yield LineStreamItem(sequence_id, resource_name, line)
+
+    def _stream_whole(self):
+        """
+        Stream lines from a small file read and decoded in one go as LineStreamItems.
+        """
+        text = self._file.read().decode(self.encoding)
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+        lines = text.split('\n')
+        if not lines[-1]:
+            lines.pop()  # A final line ending (or an empty file) doesn't start a new line
+
+        resource_name = str(self.file_path)
+        for sequence_id, line in enumerate(lines, start=1):
+            yield LineStreamItem(sequence_id, resource_name, line)
+
+    def _stream_mmap(self):
+        """
+        Stream lines from the memory mapped file as LineStreamItems.
+
+        The map is split on `\n`; a `\r` ending a chunk belongs to a `\r\n` line ending
+        and any other `\r` is an old style line ending, matching universal newlines.
+        """
+        mapped = self._mmap
+        if mapped is None:
+            return
+
+        resource_name = str(self.file_path)
+        encoding = self.encoding
+        size = len(mapped)
+        sequence_id = 0
+        start = 0
+        while start < size:
+            end = mapped.find(b'\n', start)
+            if end == -1:
+                end = size
+            chunk = mapped[start:end]
+            start = end + 1
+
+            if chunk.endswith(b'\r'):
+                chunk = chunk[:-1]
+            for line in chunk.split(b'\r') if b'\r' in chunk else (chunk,):
+                sequence_id += 1
+                yield LineStreamItem(sequence_id, resource_name, line.decode(encoding))
@@ -0,0 +1,221 @@
+"""
+This module provides private helpers shared by the folder based inputs
+(`FromFolder` and `FromGlob`).
+
+These are implementation details of the input classes and are not part of the
+public `pipethis` API.
+"""
+
+import functools
+import os
+import pathlib
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate
+from typing import Callable, Iterable
+
+from ._base import FileHandlerBase, StreamItem
+from ._logging import get_logger
+
+# Create local logger
+logger = get_logger(__name__)
+
+# fnmatch compares names with os.path.normcase, which folds case on case-insensitive
+# platforms (Windows).  The compiled patterns follow the same rule.
+_PATTERN_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+
+def _compile_patterns(patterns: list[str]) -> re.Pattern | None:
+    """
+    Compile a list of fnmatch style patterns into a single regular expression.
+
+    Matching a file name against the returned regex with `.match` is equivalent to
+    `any(fnmatch(name, pattern) for pattern in patterns)` but needs only one regex
+    dispatch per name instead of one `fnmatch` call per pattern.
+
+    The compiled regex is shared between all inputs using the same set of patterns.
+
+    Args:
+        patterns (list[str]): The fnmatch patterns, e.g. `["*.txt", "*.csv"]`.
+
+    Returns:
+        re.Pattern | None: The combined regex, or None if there are no patterns.
+    """
+    if not patterns:
+        return None
+    # Order and duplicates don't change what matches, so normalise them for the cache
+    return _compile_pattern_set(tuple(sorted(set(patterns))))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern_set(patterns: tuple[str, ...]) -> re.Pattern:
+    """
+    Compile a sorted tuple of fnmatch patterns, memoised across instances.
+    """
+    return re.compile("|".join(translate(pattern) for pattern in patterns), _PATTERN_FLAGS)
+
+
+def _make_matcher(patterns: list[str]) -> Callable[[str], bool] | None:
+    """
+    Build a function telling whether a file name matches any of `patterns`.
+
+    Patterns of the form `*.ext` (a leading `*` followed by literal text) are by far the
+    most common and are checked with a single C level `str.endswith` on a tuple of
+    suffixes; any other pattern goes through the compiled regex.  The suffix shortcut is
+    only used where names are compared case sensitively, like `fnmatch` does.
+
+    Args:
+        patterns (list[str]): The fnmatch patterns, e.g. `["*.txt", "*.csv"]`.
+
+    Returns:
+        Callable[[str], bool] | None: The matcher, or None if there are no patterns.
+    """
+    if not patterns:
+        return None
+
+    suffixes: tuple[str, ...] = ()
+    if not _PATTERN_FLAGS:
+        suffixes = tuple(pattern[1:] for pattern in patterns if _is_suffix_pattern(pattern))
+        patterns = [pattern for pattern in patterns if not _is_suffix_pattern(pattern)]
+
+    if not patterns:
+        return lambda name: name.endswith(suffixes)
+
+    match = _compile_patterns(patterns).match
+    if not suffixes:
+        return lambda name: match(name) is not None
+    return lambda name: name.endswith(suffixes) or match(name) is not None
+
+
+def _is_suffix_pattern(pattern: str) -> bool:
+    """
+    Return True for patterns like `*.txt`: a leading `*` and no other glob characters.
+    """
+    return pattern.startswith("*") and not any(char in pattern[1:] for char in "*?[")
+
+
+def _make_name_filter(keep_patterns: list[str],
+                      ignore_patterns: list[str]) -> Callable[[str], bool]:
+    """
+    Build a file name filter specialised for the configured patterns.
+
+    A name is kept if it matches none of `ignore_patterns` and, when there are any, at
+    least one of `keep_patterns`.  Deciding which checks are needed once, here, keeps the
+    per-file test down to the matching that is actually required (none at all when there
+    are no patterns).
+
+    Args:
+        keep_patterns (list[str]): Names must match one of these patterns, if given.
+        ignore_patterns (list[str]): Names matching one of these patterns are rejected.
+
+    Returns:
+        Callable[[str], bool]: Returns True for file names that should be kept.
+    """
+    keep = _make_matcher(keep_patterns)
+    ignore = _make_matcher(ignore_patterns)
+
+    if keep is None and ignore is None:
+        return lambda name: True
+
+    if ignore is None:
+        return keep
+
+    if keep is None:
+        return lambda name: not ignore(name)
+
+    return lambda name: not ignore(name) and keep(name)
+
+
+def _stream_file(file_path: pathlib.Path,
+                 handler_class: type[FileHandlerBase]) -> Iterable[StreamItem]:
+    """
+    Stream a single file found while walking a folder.
+
+    Folder inputs already know which handler class to use, so the handler is created and
+    entered directly instead of going through a `FromFile` (and its second, delegating
+    context manager) for every file.
+
+    Args:
+        file_path (pathlib.Path): Absolute path of the file to stream.
+        handler_class (type[FileHandlerBase]): The file handler class used to read the file.
+
+    Yields:
+        StreamItem: The items produced by the handler.
+    """
+    logger.info("Streaming content from the file: %s", file_path)
+    with handler_class(file_path) as handler:
+        yield from handler.stream()
+
+
+def _read_file(file_path: pathlib.Path,
+               handler_class: type[FileHandlerBase]) -> list[StreamItem]:
+    """
+    Read every item of a single file into memory, used by the prefetching workers.
+
+    Args:
+        file_path (pathlib.Path): Absolute path of the file to read.
+        handler_class (type[FileHandlerBase]): The file handler class used to read the file.
+
+    Returns:
+        list[StreamItem]: All items produced by the handler.
+    """
+    return list(_stream_file(file_path, handler_class))
+
+
+def _check_max_workers(max_workers: int) -> None:
+    """
+    Validate the `max_workers` argument of the folder inputs.
+
+    Args:
+        max_workers (int): The requested number of worker threads.
+
+    Raises:
+        ValueError: If `max_workers` is not a positive integer (booleans are rejected).
+    """
+    if isinstance(max_workers, bool) or not isinstance(max_workers, int) or max_workers < 1:
+        msg = f"max_workers must be a positive integer, got {max_workers!r}."
+        raise ValueError(msg)
+
+
+def _stream_files(file_paths: Iterable[pathlib.Path],
+                  handler_class: type[FileHandlerBase],
+                  max_workers: int = 1) -> Iterable[StreamItem]:
+    """
+    Stream several files in order, optionally reading ahead on worker threads.
+
+    With `max_workers` of 1 each file is streamed lazily, one after the other.  With more
+    workers up to `max_workers` upcoming files are read in the background while the items
+    of the current file are consumed, overlapping file I/O with pipeline processing.
+    Items are still yielded file by file in the order of `file_paths`.
+
+    Read-ahead files are held in memory in full, so only use more than one worker when
+    the individual files comfortably fit in memory.
+
+    Args:
+        file_paths (Iterable[pathlib.Path]): The files to stream, in output order.
+        handler_class (type[FileHandlerBase]): The file handler class used to read files.
+        max_workers (int): Number of files read concurrently. Defaults to 1 (no threads).
+
+    Yields:
+        StreamItem: The items of every file, in order.
+    """
+    if max_workers <= 1:
+        for file_path in file_paths:
+            yield from _stream_file(file_path, handler_class)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        try:
+            for file_path in file_paths:
+                pending.append(executor.submit(_read_file, file_path, handler_class))
+                # Keep the number of in-flight files bounded
+                if len(pending) > max_workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # If the consumer stops early, don't read files nobody will look at
+            for future in pending:
+                future.cancel()
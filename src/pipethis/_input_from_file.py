@@ -12,8 +12,10 @@ Example Usage:
     ...     for line in input_file.stream():
     ...         print(line.data)
 """
+import os
 import pathlib
 from ._base import FileHandlerBase, InputBase
+from ._file_handler import TextFileHandler
 from ._logging import get_logger
 
 # Create local logger
@@ -28,6 +30,10 @@ class FromFile(InputBase):
         filepath (str): pathlib.Path to the file to be read.
         _handler (str): The name of the handler used to read the file.
     """
+
+    __slots__ = ('_filepath', '_resolved_filepath', '_handler', '_handler_class',
+                 '_file_handler_instance')
+
     # Registry mapping extensions to file_handler classes
     _HANDLER_MAP: dict[str, type[FileHandlerBase]] = {}
 
@@ -43,8 +49,11 @@ class FromFile(InputBase):
                 the appropriate handler will be selected based on the file extension.
         """
         logger.debug("Init FromFile with path: %s", filepath)
-        self.filepath = pathlib.Path(filepath).resolve()
+        # Anchored to the current directory now, symlinks are resolved lazily (see `filepath`)
+        self._filepath = pathlib.Path(filepath).absolute()
+        self._resolved_filepath = None
         self._handler = handler  # Store the custom handler class (if any)
+        self._handler_class = handler  # Resolved handler class, filled in on first use
         self._file_handler_instance = None  # Instantiate lazily only when accessed
 
     def stream(self):
@@ -60,11 +69,11 @@ class FromFile(InputBase):
         logger.info("Streaming content from the file: %s", self.filepath)
 
         # Check if the file handler is already initialized (via a context manager)
-        handler_initialized = self._file_handler_instance is not None
+        handler = self._file_handler_instance
 
-        if handler_initialized:
+        if handler is not None:
             # If already initialized, just stream from the file handler
-            yield from self.file_handler.stream()  # pragma no cover
+            yield from handler.stream()  # pragma no cover
         else:
             # If not initialized, use a context manager to open it temporarily
             with self.file_handler as temp_handler:
@@ -88,19 +97,48 @@ class FromFile(InputBase):
             self._file_handler_instance.__exit__(exc_type, exc_value, traceback)
             self._file_handler_instance = None
 
+    @property
+    def filepath(self) -> pathlib.Path:
+        """
+        The absolute, resolved path of the file.
+
+        Resolving follows symlinks and so touches the filesystem; it is done on first access
+        rather than in `__init__` so constructing a `FromFile` stays cheap.
+        """
+        if self._resolved_filepath is None:
+            self._resolved_filepath = self._filepath.resolve()
+        return self._resolved_filepath
+
+    @filepath.setter
+    def filepath(self, filepath: str | pathlib.Path):
+        """
+        Point the input at another file.
+
+        The path is resolved again on next access and, unless a handler was given
+        explicitly, the handler class is chosen again from the new extension.
+        """
+        self._filepath = pathlib.Path(filepath).absolute()
+        self._resolved_filepath = None
+        self._handler_class = self._handler
+
     @property
     def file_handler(self) -> FileHandlerBase:
         """
         Lazily resolve and instantiate the appropriate handler for the file.
         """
-        if hasattr(self, "_file_handler_instance") and self._file_handler_instance is not None:
-            return self._file_handler_instance
+        # `__init__` always sets the attribute, so no hasattr guard is needed
+        handler = self._file_handler_instance
+        if handler is not None:
+            return handler
         return self._init_handler()
 
     def _init_handler(self):
         """Initialize a handler by creating one with the bazbaz123
         """
-        handler_class = self._get_handler(self.filepath, self._handler)
+        # The class only depends on the path, so it is looked up once per FromFile
+        handler_class = self._handler_class
+        if handler_class is None:
+            handler_class = self._handler_class = self._get_handler(self.filepath, self._handler)
 
         # Instantiate the handler with the file path
         self._file_handler_instance = handler_class(self.filepath)
@@ -123,17 +161,10 @@ class FromFile(InputBase):
         if handler is not None:
             return handler
 
-        # Otherwise, look up the file_handler in the registry
-        extension = filepath.suffix.lower()
-        handler_class = self._HANDLER_MAP.get(extension)
-
-        # Return the matched handler or default to TextFileHandler
-        if handler_class is not None:
-            return handler_class
-
-        # Default to TextFileHandler if no match is found in HANDLER_MAP
-        from ._file_handler import TextFileHandler
-        return TextFileHandler
+        # Otherwise, look up the file_handler in the registry, defaulting to TextFileHandler.
+        # os.path.splitext is a plain string split, cheaper than pathlib's suffix parsing.
+        extension = os.path.splitext(filepath.name)[1].lower()
+        return self._HANDLER_MAP.get(extension, TextFileHandler)
 
     @classmethod
     def clear_registered_handlers(cls):
@@ -13,12 +13,13 @@ Example Usage:
     ...         print(line.data)
 """
 
+import os
 import pathlib
-from typing import Type
+from typing import Callable, Type
 
 from ._base import FileHandlerBase, InputBase
 from ._file_handler import TextFileHandler
-from ._input_from_file import FromFile
+from ._file_utils import _check_max_workers, _make_name_filter, _stream_files
 from ._logging import get_logger
 
 # Create local logger
@@ -49,12 +50,15 @@ class FromFolder(InputBase):
         ValueError: If both `keep_patterns` and `ignore_patterns` are provided simultaneously.
     """
 
+    __slots__ = ('folder_path', 'file_handler', 'keep_patterns', 'ignore_patterns', 'max_workers')
+
     def __init__(
             self,
             folder_path: pathlib.Path | str,
             file_handler: Type[FileHandlerBase] | None = None,
             keep_patterns: list[str] | str | None = None,
             ignore_patterns: list[str] | str | None = None,
+            max_workers: int = 1,
     ):
         """
         Initializes the `FromFolder` instance.
@@ -73,9 +77,13 @@ class FromFolder(InputBase):
             ignore_patterns (list[str] | None): List of exclusion patterns for filtering files.
                                                 Files matching these patterns will be ignored.
                                                 Examples: ['*.log', '*.tmp'].
+            max_workers (int): Number of files read ahead on worker threads while earlier files
+                               are consumed. Defaults to 1, which reads files lazily on the
+                               calling thread. Read-ahead files are held in memory in full.
 
         Raises:
-            ValueError: If both `keep_patterns` and `ignore_patterns` are provided simultaneously.
+            ValueError: If both `keep_patterns` and `ignore_patterns` are provided simultaneously,
+                        or if `max_workers` is not a positive integer.
         """
 
         logger.debug("Init FromFolder with path: %s", folder_path)
@@ -84,12 +92,15 @@ class FromFolder(InputBase):
         self.file_handler = file_handler or TextFileHandler
         self.keep_patterns = self._list_or_string(keep_patterns)
         self.ignore_patterns = self._list_or_string(ignore_patterns)
+        self.max_workers = max_workers
 
         # Validate that both lists are not simultaneously set
         if self.keep_patterns and self.ignore_patterns:
             msg = "You can specify either keep_patterns or ignore_patterns, but not both."
             raise ValueError(msg)
 
+        _check_max_workers(max_workers)
+
     def __enter__(self):
         """
         Enter the context for file handling.
@@ -135,14 +146,29 @@ class FromFolder(InputBase):
                 print(item)
             ```
         """
-        for file_path in self.folder_path.iterdir():
-            if not self._should_include(file_path):
-                continue
+        return _stream_files(self._iter_files(), self.file_handler, self.max_workers)
 
-            with FromFile(filepath=file_path, handler=self.file_handler) as from_file:
-                yield from from_file.stream()
+    def _iter_files(self):
+        """
+        Yield the absolute path of every file in the folder that should be streamed.
 
-    def _should_include(self, file_path: pathlib.Path) -> bool:
+        Yields:
+            pathlib.Path: Files that pass the pattern filters, in directory order.
+        """
+        # Patterns are compiled into one specialised name check per stream (from the current
+        # attributes) rather than re-matched pattern by pattern per file
+        name_filter = _make_name_filter(self.keep_patterns, self.ignore_patterns)
+
+        # scandir entries carry the file type from the directory listing itself, so
+        # skipping folders does not need an extra stat call per entry.
+        # The folder is resolved once, so every entry path is absolute and free of
+        # symlinks in the folder path itself, without resolving each file.
+        with os.scandir(os.path.realpath(self.folder_path)) as entries:
+            for entry in entries:
+                if self._should_include(entry, name_filter):
+                    yield pathlib.Path(entry.path)
+
+    def _should_include(self, entry: os.DirEntry, name_filter: Callable[[str], bool]) -> bool:
         """
         Determine whether a file should be included in the processing.
 
@@ -155,24 +181,19 @@ class FromFolder(InputBase):
         2. Files are included based on `keep_patterns` if specified.
         3. Files matching `ignore_patterns` are excluded if specified.
 
+        Patterns are matched against the file name only.
+
         Args:
-            file_path (pathlib.Path): The path of the file to evaluate.
+            entry (os.DirEntry): The folder entry of the file to evaluate.
+            name_filter (Callable[[str], bool]): The compiled pattern check for this stream.
 
         Returns:
             bool: True if the file should be included; False otherwise.
         """
-        # Skip directories
-        if file_path.is_dir():
-            return False
-
-        # Check keep_patterns (if specified)
-        if self.keep_patterns:
-            if not any(file_path.match(pattern) for pattern in self.keep_patterns):
-                return False
-
-        # Check ignore_patterns (if specified)
-        if self.ignore_patterns:
-            if any(file_path.match(pattern) for pattern in self.ignore_patterns):
-                return False
-
-        return True
+        # Skip directories (including symlinks to directories), then apply the patterns.
+        # An entry whose type can't be read is treated as a file, as FromGlob does.
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        return not is_dir and name_filter(entry.name)
@@ -14,24 +14,70 @@ Example Usage:
 """
 
 import os
-from fnmatch import fnmatch
 from pathlib import Path
-from typing import Iterable, Type
+from typing import Callable, Iterable, Type
 
 from ._base import FileHandlerBase, InputBase
 from ._file_handler import TextFileHandler
-from ._input_from_file import FromFile
+from ._file_utils import _check_max_workers, _make_matcher, _make_name_filter, _stream_files
 from ._logging import get_logger
 
 # Create local logger
 logger = get_logger(__name__)
 
+# Characters that make a path segment a glob pattern rather than a literal name
+_GLOB_CHARS = "*?["
+
+
+def _split_prefix(pattern: str) -> tuple[str, str]:
+    """
+    Split a glob pattern into its literal leading directories and the remaining pattern.
+
+    For example `"logs/2024/*.txt"` splits into `("logs/2024", "*.txt")` while `"*.txt"`
+    has no literal directory and splits into `("", "*.txt")`.  Absolute and relative
+    (`.`/`..`) segments are never treated as part of the prefix.
+
+    Args:
+        pattern (str): The glob pattern to split.
+
+    Returns:
+        tuple[str, str]: The `/` separated literal prefix and the remaining pattern.
+    """
+    segments = pattern.replace(os.sep, "/").split("/")
+    literal = []
+    for segment in segments[:-1]:
+        if not segment or segment in (".", "..") or any(c in segment for c in _GLOB_CHARS):
+            break
+        literal.append(segment)
+    return "/".join(literal), "/".join(segments[len(literal):])
+
+
+def _active_keep_patterns(scoped_keep: list[tuple[str, str]], relative: str) -> list[str]:
+    """
+    Return the keep patterns that apply to files directly inside a folder.
+
+    Patterns without a folder prefix apply everywhere; prefixed patterns only apply at
+    or below their folder and are returned with the prefix stripped.
+
+    Args:
+        scoped_keep (list[tuple[str, str]]): The keep patterns split by `_split_prefix`.
+        relative (str): The folder, as a `/` separated path relative to the walked folder.
+
+    Returns:
+        list[str]: File name patterns to match against files in the folder.
+    """
+    return [pattern for prefix, pattern in scoped_keep
+            if not prefix or relative == prefix or relative.startswith(prefix + "/")]
+
 
 class FromGlob(InputBase):
     """
     Reads data by matching file paths using glob patterns.
     """
 
+    __slots__ = ('folder_path', 'file_handler', 'keep_patterns', 'ignore_patterns',
+                 'ignore_folders', 'max_workers')
+
     def __init__(
             self,
             folder_path: Path | str,
@@ -39,6 +85,7 @@ class FromGlob(InputBase):
             ignore_folders: list[str] | str | None = None,
             keep_patterns: list[str] | str | None = None,
             ignore_patterns: list[str] | str | None = None,
+            max_workers: int = 1,
     ):
         """
         Initializes the `FromGlob` class to process and filter files from a directory
@@ -55,19 +102,29 @@ class FromGlob(InputBase):
             folder_path (Path | str): The root directory to search for files.
             file_handler (Type[FileHandlerBase] | None): A custom class for handling files.
                 This class determines how files will be read or streamed. If not provided,
-                the default registry-based handler will be used.
+                `TextFileHandler` is used for every file.
             ignore_folders (list[str] | None): A list of folder names to exclude from traversal.
-                Folders with names matching these patterns will be skipped.
+                Folders with names matching these patterns will be skipped. Entries may be
+                plain names (`"build"`) or glob patterns (`"node_modules*"`). A folder whose
+                name equals an entry is always skipped; an entry containing `*`, `?` or `[`
+                also skips every folder name it matches as a glob pattern.
             keep_patterns (list[str] | None): A list of patterns to include in the results.
                 Examples include `["*.txt", "*.csv"]`. If this is not empty, only files matching
                 these patterns will be processed. Conflicts with `ignore_patterns`.
+                A pattern may start with literal folder names (e.g. `"logs/*.txt"`), in which
+                case it only matches files at or below that folder.  When every keep pattern
+                has such a prefix only those folders are walked.
             ignore_patterns (list[str] | None): A list of patterns to exclude from the results.
                 Examples include `["*.log", "*.tmp"]`. If this is set, files matching these
                 patterns will be ignored.
                 **Priority**: Ignore patterns take precedence over keep patterns.
+            max_workers (int): Number of files read ahead on worker threads while earlier
+                files are consumed. Defaults to 1, which reads files lazily on the calling
+                thread. Read-ahead files are held in memory in full.
 
         Raises:
-            ValueError: If both `keep_patterns` and `ignore_patterns` are provided simultaneously.
+            ValueError: If both `keep_patterns` and `ignore_patterns` are provided simultaneously,
+                or if `max_workers` is not a positive integer.
         """
         logger.debug("Init FromGlob with path: %s keep=%s ignore=%s",
                      folder_path, keep_patterns, ignore_patterns)
@@ -77,12 +134,15 @@ class FromGlob(InputBase):
         self.keep_patterns = self._list_or_string(keep_patterns)
         self.ignore_patterns = self._list_or_string(ignore_patterns)
         self.ignore_folders = self._list_or_string(ignore_folders)
+        self.max_workers = max_workers
 
         # Validate that both lists are not simultaneously set
         if self.keep_patterns and self.ignore_patterns:
             msg = "You can specify either keep_patterns or ignore_patterns, but not both."
             raise ValueError(msg)
 
+        _check_max_workers(max_workers)
+
         if not self.folder_path.exists():
             msg = f"Glob folder_path {self.folder_path} does not exist."
             raise ValueError(msg)
@@ -103,17 +163,20 @@ class FromGlob(InputBase):
         """
             Traverse the folder and stream files that match the filtering criteria.
 
-            The folder traversal uses `os.walk`, which provides a tree-like iteration over all
-            directories and their subdirectories. For each directory:
+            The folder traversal visits the folder and its subdirectories top-down, in the same
+            order as `os.walk`. For each directory:
             - Subdirectories listed in `ignore_folders` are skipped.
             - Files are checked against `keep_patterns` and `ignore_patterns` using glob matching.
 
-            NOTE: os.walk is used because it is faster, it allows you to exclude folders without
-            walking them.  When used this can dramatically speed up processing...at the cost
-            of not using the rglob feature of pathlib.
+            NOTE: the folders are walked with os.scandir rather than pathlib's rglob because it
+            is faster and it allows you to exclude folders without walking them.  When used
+            this can dramatically speed up processing.
 
             Globbing Mechanics:
-            - Each file is matched against the patterns provided using the `fnmatch` module.
+            - Each file name is matched with `fnmatch` semantics by a filter that is compiled
+              once per set of active patterns (see `_name_filter`), not pattern by pattern.
+            - Keep patterns with a folder prefix (e.g. `logs/*.txt`) only apply to files at or
+              below that folder.
             - If a file matches an ignore pattern (in `ignore_patterns`), it is skipped even if
               it matches a keep pattern.
             - If `keep_patterns` is provided, files must match at least one pattern from this list.
@@ -142,42 +205,140 @@ class FromGlob(InputBase):
                     >>> list(from_glob.stream())
                     [Path('/data/file1.csv'), Path('/data/subdir/file2.csv')]
             """
+        return _stream_files(self._iter_files(), self.file_handler, self.max_workers)
 
-        for root, dirs, files in os.walk(self.folder_path):
-            # Modify the 'dirs' list in-place (since it is mutable) to exclude ignored folders.
-            # By using 'dirs[:]', we write into the original 'dirs' list that 'os.walk'
-            # uses internally. This ensures that the ignored folders are skipped during
-            # traversal in subsequent iterations.
-            dirs[:] = [d for d in dirs if d not in self.ignore_folders]
-
-            # Iterate through files in the remaining folders
-            for file in files:
-                file_path = Path(root, file)
-
-                # Apply the matching rules
-                if self._should_keep(file_path.name):
-                    # Use context management for FromFile to handle resources
-                    with FromFile(filepath=file_path,
-                                  handler=self.file_handler) as from_file:
-                        yield from from_file.stream()
-
-    def _should_keep(self, filename: str) -> bool:
+    def _make_folder_filter(self) -> Callable[[str], bool]:
         """
-        Checks if a file should be included based on `keep_patterns` and `ignore_patterns`.
+        Build the test deciding whether a folder name is in `ignore_folders`.
+
+        Names are looked up exactly in a set, so a literal folder name containing glob
+        characters still matches itself.  Entries containing glob characters are also
+        combined into a single matcher, which is only consulted when such entries exist.
+        The filter is built when a walk starts, so changes to `ignore_folders` are honoured.
+
+        Returns:
+            Callable[[str], bool]: Returns True for folder names that should be skipped.
+        """
+        folders = frozenset(self.ignore_folders)
+        match = _make_matcher(sorted(name for name in folders
+                                     if any(c in name for c in _GLOB_CHARS)))
+
+        if match is None:
+            return folders.__contains__
+        return lambda name: name in folders or match(name)
+
+    def _iter_files(self) -> Iterable[Path]:
+        """
+        Walk the folder and yield the absolute path of every file that should be streamed.
+
+        The walk is an explicit depth first stack over `os.scandir`, visiting folders in the
+        same order as a top-down `os.walk`.  File names are filtered straight from the
+        directory entries, and a `Path` is only built for files that are kept.  Like
+        `os.walk`, symlinks to folders are not followed and unreadable folders are skipped.
+
+        The filters are built from the current attributes when the walk starts.
+
+        Yields:
+            Path: Files that pass the folder and pattern filters, in walk order.
+        """
+        is_ignored_folder = self._make_folder_filter()
+        # Keep patterns split into (literal folder prefix, file name pattern)
+        scoped_keep = [_split_prefix(pattern) for pattern in self.keep_patterns]
+        # Name filters are built once per set of active keep patterns, see `_name_filter`
+        name_filters: dict[tuple[str, ...], Callable[[str], bool]] = {}
+        # Resolved once, so symlinks in the folder path itself are followed as before
+        # without resolving every file found below it
+        folder_path = os.path.realpath(self.folder_path)
+
+        for walk_root in self._walk_roots(scoped_keep, is_ignored_folder):
+            # Each stack entry is (absolute folder, "/" separated path relative to folder_path)
+            stack = [(os.path.join(folder_path, walk_root), walk_root)]
+            while stack:
+                folder, relative = stack.pop()
+
+                # The name filter is resolved once per folder rather than once per file
+                name_filter = self._name_filter(_active_keep_patterns(scoped_keep, relative),
+                                                name_filters)
+                subfolders = []
+                try:
+                    with os.scandir(folder) as entries:
+                        for entry in entries:
+                            try:
+                                is_dir = entry.is_dir()
+                            except OSError:
+                                is_dir = False
+
+                            if not is_dir:
+                                # Apply the matching rules to the bare name first so
+                                # filtered out files never pay for building a path
+                                if name_filter(entry.name):
+                                    yield Path(entry.path)
+                            elif not is_ignored_folder(entry.name) and not entry.is_symlink():
+                                subfolders.append(
+                                    (entry.path, f"{relative}/{entry.name}" if relative
+                                     else entry.name))
+                except OSError:
+                    logger.debug("Skipping unreadable folder: %s", folder)
+                    continue
+
+                # Reversed so the first sub folder is walked next, as os.walk would
+                stack.extend(reversed(subfolders))
+
+    @staticmethod
+    def _walk_roots(scoped_keep: list[tuple[str, str]],
+                    is_ignored_folder: Callable[[str], bool]) -> list[str]:
+        """
+        Determine which folders need to be walked.
+
+        If every keep pattern starts with a literal folder prefix, only those folders can
+        contain matches, so they are walked instead of the whole tree.  Prefixes nested
+        inside another prefix are dropped so no file is visited twice, and prefixes that
+        pass through an ignored folder are skipped entirely.
 
         Args:
-            filename (str): Name of the file.
+            scoped_keep (list[tuple[str, str]]): The keep patterns split by `_split_prefix`.
+            is_ignored_folder (Callable[[str], bool]): The folder filter for this walk.
 
         Returns:
-            bool: True if the file passes all filters and should be kept, False otherwise.
+            list[str]: The folders to walk, as `/` separated paths relative to `folder_path`
+                (`""` is `folder_path` itself).
+        """
+        prefixes = [prefix for prefix, _ in scoped_keep]
+        if not prefixes or not all(prefixes):
+            return [""]
+
+        roots: list[str] = []
+        # Sorting puts every prefix after any prefix that contains it
+        for prefix in sorted(set(prefixes)):
+            if any(prefix.startswith(root + "/") for root in roots):
+                continue
+            if any(map(is_ignored_folder, prefix.split("/"))):
+                continue
+            roots.append(prefix)
+
+        return roots
+
+    def _name_filter(self, keep_patterns: list[str],
+                     name_filters: dict[tuple[str, ...], Callable[[str], bool]]
+                     ) -> Callable[[str], bool]:
         """
-        # Ignore patterns take precedence: if a file matches an ignore pattern, skip it
-        if any(fnmatch(filename, pattern) for pattern in self.ignore_patterns):
-            return False
+        Return the file name filter for a set of active keep patterns, building it on first use.
 
-        # If keep patterns are specified, the file must match at least one
-        if self.keep_patterns:
-            return any(fnmatch(filename, pattern) for pattern in self.keep_patterns)
+        Only a handful of distinct pattern sets exist in one walk (one per folder prefix
+        combination), so the filters are cached in `name_filters` for the walk.
 
-        # If no keep patterns are specified, include by default
-        return True
+        Args:
+            keep_patterns (list[str]): The keep patterns active for a folder.
+            name_filters (dict): The filters built so far in this walk, keyed by pattern set.
+
+        Returns:
+            Callable[[str], bool]: Returns True for file names that should be kept.
+        """
+        key = tuple(keep_patterns)
+        if key not in name_filters:
+            if self.keep_patterns and not keep_patterns:
+                # Keep patterns exist, but none of them apply to this folder
+                name_filters[key] = lambda name: False
+            else:
+                name_filters[key] = _make_name_filter(keep_patterns, self.ignore_patterns)
+        return name_filters[key]
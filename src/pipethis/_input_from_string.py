@@ -12,7 +12,8 @@ Example Usage:
     >>> for item in input_stream.stream():
     ...     print(item.sequence_id, item.data)
 """
-from typing import Iterable
+import sys
+from typing import Iterable, Iterator
 
 from ._base import InputBase
 from ._logging import get_logger
@@ -21,6 +22,66 @@ from ._streamitem import LineStreamItem
 # Create local logger
 logger = get_logger(__name__)
 
+# Texts up to this many characters are split in one `str.split` call; longer texts are
+# split lazily so their chunks are never all held in memory at once.
+_SPLIT_ALL_MAX = 1024 * 1024
+
+
+def _iter_split(text: str, sep: str) -> Iterator[str]:
+    """
+    Lazily split `text` on `sep`, yielding the same chunks as `text.split(sep)`.
+
+    Unlike `str.split` this never builds the full list of chunks for texts longer than
+    `_SPLIT_ALL_MAX`, so large texts are streamed with constant extra memory.  Shorter
+    texts are split in one C level call, which is faster than a `find` per chunk.
+
+    Raises:
+        ValueError: If `sep` is empty, matching `str.split`.
+    """
+    if not sep:
+        raise ValueError("empty separator")
+
+    if len(text) <= _SPLIT_ALL_MAX:
+        yield from text.split(sep)
+        return
+
+    sep_len = len(sep)
+    start = 0
+    index = text.find(sep)
+    while index != -1:
+        yield text[start:index]
+        start = index + sep_len
+        index = text.find(sep, start)
+    yield text[start:]
+
+
+def _stream_line(line: str, sep: str, resource_name: str) -> Iterable[LineStreamItem]:
+    """
+    Split a single string on `sep` and yield each chunk as a `LineStreamItem`.
+
+    Shared by `FromString` and `FromStrings` so that streaming many strings does not
+    require building a `FromString` object for every one of them.
+    """
+    # Same loop as `_iter_split`, fused in here to skip a generator hop per chunk
+    if not sep:
+        raise ValueError("empty separator")
+
+    if len(line) <= _SPLIT_ALL_MAX:
+        for line_number, data in enumerate(line.split(sep), start=1):
+            yield LineStreamItem(line_number, resource_name, data)
+        return
+
+    sep_len = len(sep)
+    line_number = 1
+    start = 0
+    index = line.find(sep)
+    while index != -1:
+        yield LineStreamItem(line_number, resource_name, line[start:index])
+        line_number += 1
+        start = index + sep_len
+        index = line.find(sep, start)
+    yield LineStreamItem(line_number, resource_name, line[start:])
+
 
 class FromString(InputBase):
     """
@@ -44,6 +105,8 @@ class FromString(InputBase):
         3 line3
     """
 
+    __slots__ = ('text', 'sep', 'name')
+
     def __init__(self, text: str, sep='\n', name='text'):
         """
         Initialize the FromString instance.
@@ -53,7 +116,8 @@ class FromString(InputBase):
             text (str): The string data to stream from.
             sep (str, optional): Separator for splitting string into lines. Defaults to '\n'.
         """
-        self.name = name
+        # Interned like the FromStrings names, so equal resource names share one object
+        self.name = sys.intern(name)
         self.text = text
         self.sep = sep
 
@@ -72,5 +136,4 @@ class FromString(InputBase):
 
     def stream(self) -> Iterable[LineStreamItem]:
         """Stream lines split by the specified sep."""
-        for line_number, data in enumerate(self.text.split(self.sep), start=1):
-            yield LineStreamItem(sequence_id=line_number, resource_name=self.name, data=data)
+        yield from _stream_line(self.text, self.sep, self.name)
@@ -14,10 +14,11 @@ Example Usage:
     ...     print(item.sequence_id, item.data)
 """
 
+import sys
 from typing import Iterable
 
 from ._base import InputBase
-from ._input_from_string import FromString
+from ._input_from_string import _iter_split, _stream_line
 from ._logging import get_logger
 from ._streamitem import LineStreamItem
 
@@ -42,6 +43,8 @@ class FromStrings(InputBase):
         sep (str): The sep used to split each string into smaller chunks. Defaults to '\n'.
     """
 
+    __slots__ = ('lines', 'sep', 'name')
+
     def __init__(self, lines: list[str] | str, sep: str = '\n', name: str = 'text'):
         """
         Initialize the FromStrings instance.
@@ -56,7 +59,9 @@ class FromStrings(InputBase):
         if isinstance(lines, str):
             lines = [lines]
 
-        self.name = name
+        # Only the base name is interned: per-string names are not, as interned strings are
+        # never freed on some interpreters and would grow with every input string.
+        self.name = sys.intern(name)
         self.lines = lines
         self.sep = sep
 
@@ -109,6 +114,41 @@ class FromStrings(InputBase):
             3 line.
         """
         for id_, line in enumerate(self.lines, start=1):
-            # Use the generator returned by FromString to handle separation and streaming
-            from_string = FromString(line, sep=self.sep, name=f"{self.name}-{id_}").stream()
-            yield from from_string
+            yield from _stream_line(line, self.sep, f"{self.name}-{id_}")
+
+    def stream_batched(self) -> Iterable[tuple[str, list[str]]]:
+        """
+        Stream each input string as a single `(resource_name, chunks)` tuple.
+
+        Every chunk of a given input string shares the same resource name, so rather than
+        building one `LineStreamItem` per chunk this yields the resource name once along with
+        the list of chunks.  Useful for consumers that just iterate over the data and don't
+        need the per-item wrapper.
+
+        Yields:
+            tuple[str, list[str]]: The resource name and the chunks of one input string.
+
+        Example:
+            >>> from_strings = FromStrings(["a b", "c"], sep=' ', name='test')
+            >>> list(from_strings.stream_batched())
+            [('test-1', ['a', 'b']), ('test-2', ['c'])]
+        """
+        for id_, line in enumerate(self.lines, start=1):
+            yield f"{self.name}-{id_}", line.split(self.sep)
+
+    def stream_raw(self) -> Iterable[tuple[int, str, str]]:
+        """
+        Stream the processed strings as plain `(sequence_id, resource_name, data)` tuples.
+
+        This is the performance path for consumers that only read the fields: building a
+        tuple is much cheaper than constructing (and validating) a `LineStreamItem`.  The
+        tuple fields are in the same order as the `LineStreamItem` fields, so
+        `LineStreamItem(*item)` recovers the full object when needed.
+
+        Yields:
+            tuple[int, str, str]: The sequence id, resource name and data of each chunk.
+        """
+        for id_, line in enumerate(self.lines, start=1):
+            resource_name = f"{self.name}-{id_}"
+            for sequence_id, data in enumerate(_iter_split(line, self.sep), start=1):
+                yield sequence_id, resource_name, data
@@ -12,6 +12,9 @@ Example Usage:
     ...         file_output.write(item)
 """
 
+import codecs
+import os
+
 from ._base import OutputBase
 from ._logging import get_logger
 from ._streamitem import LineStreamItem
@@ -26,8 +29,21 @@ class ToFile(OutputBase):
 
     This class writes output to a file specified by the user, with customizable
     file mode and encoding.
+
+    For the common stateless encodings on platforms whose line ending is `\n`, the file
+    is opened in binary mode, bypassing the text I/O layer: each line is encoded as it is
+    written and the encoded lines are handed to the file in blocks of roughly
+    `BUFFER_SIZE` bytes.  Otherwise lines are written through the (buffered) text file.
+    Either way an encoding error is raised by the `write` of the offending line, and the
+    lines written before it still reach the file.
     """
 
+    # Number of buffered bytes that triggers a write to the file (binary mode)
+    BUFFER_SIZE = 64 * 1024
+
+    # Encodings that encode each block independently (no BOM or other state)
+    _BINARY_ENCODINGS = ("utf-8", "ascii", "iso8859-1")
+
     def __init__(self, file_name=None, mode='w', encoding="utf-8"):
         """
         Initialize the file writer.
@@ -44,10 +60,22 @@ class ToFile(OutputBase):
         self.mode = mode
         self.encoding = encoding
         self.file = None  # File will be opened in context
+        self._buffer: list[bytes] = []
+        self._buffer_len = 0
+        self._binary = False
 
     def __enter__(self):
         """Open the file and return the instance."""
-        self.file = open(self.file_name, mode=self.mode, encoding=self.encoding)
+        # Text mode only adds newline translation (none needed when the platform uses
+        # '\n') and per write encoding, which a stateless encoding can do per block.
+        self._binary = (os.linesep == "\n" and "b" not in self.mode
+                        and codecs.lookup(self.encoding).name in self._BINARY_ENCODINGS)
+        if self._binary:
+            self.file = open(self.file_name, mode=self.mode.replace("t", "") + "b",
+                             buffering=1024 * 1024)
+        else:
+            self.file = open(self.file_name, mode=self.mode, encoding=self.encoding,
+                             buffering=1024 * 1024)
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -61,12 +89,35 @@ class ToFile(OutputBase):
         Args:
             lineinfo (LineStreamItem): The LineInfo object to write.
         """
-        msg = lineinfo.data + "\n"
-        self.file.write(msg)
+        if not self._binary:
+            self.file.write(lineinfo.data + "\n")
+            return
+
+        # Encoded now, so a bad line fails here rather than when its block is written
+        data = lineinfo.data.encode(self.encoding)
+        self._buffer.append(data)
+        self._buffer.append(b"\n")
+        self._buffer_len += len(data) + 1
+        if self._buffer_len >= self.BUFFER_SIZE:
+            self.flush()
+
+    def flush(self):
+        """
+        Write any buffered lines to the file.
+        """
+        if self._buffer:
+            block = b"".join(self._buffer)
+            self._buffer.clear()
+            self._buffer_len = 0
+            self.file.write(block)
 
     def close(self):
         """
-        Close the file if writing to a file.
+        Flush buffered lines and close the file if writing to a file.
         """
         if self.file:
-            self.file.close()
+            try:
+                self.flush()
+            finally:
+                self.file.close()
+                self.file = None
@@ -24,6 +24,9 @@ from ._streamitem import LineStreamItem
 # Create local logger
 logger = get_logger(__name__)
 
+# Shared encoder, looked up once instead of through `json.dumps` for every record
+_encode = json.JSONEncoder().encode
+
 
 class ToJson(OutputBase):
     """
@@ -31,6 +34,15 @@ class ToJson(OutputBase):
 
     This class writes output to a file specified by the user, with customizable
     file mode and encoding.
+
+    Records are encoded and written to the file as they arrive, so neither the records nor
+    the whole document are held in memory.  Because the record count is only known at the
+    end, the `header` object is written after the `records` array:
+
+        {"records": [{...}, {...}], "header": {"description": ..., "date": ..., "count": 2}}
+
+    Pass `keep_records=True` to also keep the written records in `records` (and in
+    `json_data` after closing), as earlier versions did.
     """
 
     def __init__(self,
@@ -38,7 +50,9 @@ class ToJson(OutputBase):
                  mode: str = 'w',
                  encoding: str = "utf-8",
                  description: str | None = None,
-                 run_date: dt.datetime | str | None = None):
+                 run_date: dt.datetime | str | None = None,
+                 *,
+                 keep_records: bool = False):
         """
         Initializes a class for managing JSON data with attributes for file handling and metadata.
         This class is designed to handle JSON files by opening them in a specified mode and encoding
@@ -51,6 +65,8 @@ class ToJson(OutputBase):
             encoding (str, optional): The file encoding. Defaults to "utf-8".
             description (str, optional): A description of the data. Defaults to None.
             run_date (str, optional): The date and time the data was processed. Defaults to None.
+            keep_records (bool, optional): Keep every written record in `records` as well.
+                Defaults to False, so records are only streamed to the file.
 
         """
         super().__init__()
@@ -58,45 +74,98 @@ class ToJson(OutputBase):
         logger.debug("Init ToJson with file: %s", file_name)
         self.mode = mode
         self.encoding = encoding
-        self.file = None  # File will be opened in context
-        self.description = description or "JSON Data"
+        self.file = None  # File is opened in context (or by the first write or close)
         self.records = []
+        self.keep_records = keep_records
 
         if run_date is None:
-            self.run_date = dt.datetime.now().isoformat()
-        elif isinstance(run_date, str):
-            self.run_date = run_date  # ISO Format required
+            run_date = dt.datetime.now().isoformat()
         elif isinstance(run_date, dt.datetime):
-            self.run_date = run_date.isoformat()
-        else:
+            run_date = run_date.isoformat()
+        elif not isinstance(run_date, str):  # ISO Format required for strings
             raise ValueError("Invalid run_date type. Must be str or datetime.datetime.")
-        self.json_data = {}
+        # The count is that of the records written to the current file
+        self.header = {'description': description or "JSON Data", 'date': run_date, 'count': 0}
+        self.json_data = {}  # Filled in by `close`, empty while the file is being written
+
+    @property
+    def description(self) -> str:
+        """The description written to the header."""
+        return self.header['description']
+
+    @description.setter
+    def description(self, description: str):
+        self.header['description'] = description
+
+    @property
+    def run_date(self) -> str:
+        """The ISO 8601 run date written to the header."""
+        return self.header['date']
+
+    @run_date.setter
+    def run_date(self, run_date: str):
+        self.header['date'] = run_date
 
     def __enter__(self):
-        """Open the file and return the instance."""
+        """Open the file, start the records array and return the instance."""
+        if self.file is None:
+            self._open()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         """ Ensure the file is closed properly on exit. """
         self.close()
 
+    def _open(self):
+        """
+        Open the output file and start the records array.
+
+        Records kept from an earlier context are written again, so the file always holds
+        everything in `records`, as it did when the whole document was dumped on close.
+        """
+        # The file stays open across writes and is closed by `close`
+        self.file = open(self.file_name,  # pylint: disable=consider-using-with
+                         mode=self.mode, encoding=self.encoding)
+        self.file.write('{"records": [' + ", ".join(map(_encode, self.records)))
+        self.header['count'] = len(self.records)
+        self.json_data = {}
+
     def write(self, lineinfo: LineStreamItem):
         """
         Write the output of a LineInfo object to a file.
 
         Args:
             lineinfo (LineStreamItem): The LineInfo object to write.
+
+        Raises:
+            ValueError: If the output has already been closed.
         """
-        self.records.append({'sequence_id': lineinfo.sequence_id,
-                             'resource_name': lineinfo.resource_name,
-                             'data': lineinfo.data})
+        if self.file is None:
+            if self.json_data:
+                raise ValueError(f"Cannot write to closed json output {self.file_name}.")
+            self._open()
+
+        record = {'sequence_id': lineinfo.sequence_id,
+                  'resource_name': lineinfo.resource_name,
+                  'data': lineinfo.data}
+        if self.keep_records:
+            self.records.append(record)
+        encoded = _encode(record)
+        header = self.header
+        self.file.write(", " + encoded if header['count'] else encoded)
+        header['count'] += 1
 
     def close(self):
-        """Save the records to a json file."""
-        self.json_data = {'header': {'description': self.description,
-                                     'date': self.run_date,
-                                     'count': len(self.records)},
-                          'records': self.records}
+        """Finish the records array, write the header and close the json file."""
+        if self.file is None:
+            if self.json_data:
+                return  # Already closed
+            self._open()
+
+        self.json_data = {'header': dict(self.header), 'records': self.records}
         # Ensure the file is closed properly on exit.
-        with open(self.file_name, mode=self.mode, encoding=self.encoding) as outfile:
-            json.dump(self.json_data, outfile)
+        try:
+            self.file.write('], "header": ' + _encode(self.header) + '}')
+        finally:
+            self.file.close()
+            self.file = None
@@ -13,6 +13,8 @@ Example Usage:
     ...     output.write(item)
 """
 
+import sys
+
 from ._base import OutputBase
 from ._logging import get_logger
 from ._streamitem import LineStreamItem
@@ -24,11 +26,19 @@ logger = get_logger(__name__)
 class ToStdOut(OutputBase):
     """
     A class to handle output directed to the standard output stream.
+
+    Inside a `with` block (as used by `Pipeline`) lines are collected and written to
+    `sys.stdout` in batches of `BUFFER_LINES`, with any remainder written on exit.
+    Outside a context every line is written immediately.
     """
 
+    # Number of buffered lines that triggers a write to stdout
+    BUFFER_LINES = 1024
+
     def __init__(self):
         super().__init__()
         logger.debug("Init ToStdOut")
+        self._buffer: list[str] | None = None  # Only buffered inside a context
 
     def write(self, lineinfo: LineStreamItem):
         """
@@ -37,21 +47,49 @@ class ToStdOut(OutputBase):
         Args:
             lineinfo (LineStreamItem): The LineInfo object to write.
         """
-        super().__init__()
-        print(lineinfo.data)
+        if self._buffer is None:
+            sys.stdout.write(lineinfo.data + "\n")
+            return
+
+        self._buffer.append(lineinfo.data)
+        self._buffer.append("\n")
+        if len(self._buffer) >= 2 * self.BUFFER_LINES:
+            self.flush()
+
+    def flush(self):
+        """
+        Write any buffered lines to stdout.
+        """
+        if self._buffer:
+            # Looked up on every flush so a replaced sys.stdout (e.g. redirection) is honoured
+            sys.stdout.write("".join(self._buffer))
+            self._buffer.clear()
 
     def __enter__(self):
         """
         Enter the runtime context. Typically used to perform setup operations.
+
+        Starts buffering the written lines.
         """
+        self._buffer = []
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         """
         Exit the runtime context. Typically used to perform cleanup operations.
 
+        Writes any buffered lines and stops buffering.
+
         Args:
             exc_type (type): Exception type, if an exception occurred.
             exc_value (Exception): Exception instance, if an exception occurred.
             traceback (Traceback): Traceback object for the exception.
         """
+        self.close()
+
+    def close(self):
+        """
+        Write any buffered lines and stop buffering.
+        """
+        self.flush()
+        self._buffer = None
@@ -36,7 +36,23 @@ class ToString(OutputBase):
         """
         super().__init__()
         logger.debug("Init ToString")
-        self.text_output = ""  # This will store the concatenated string
+        # Written pieces, joined only when `text_output` is read.  Repeated `+=` on one
+        # string can copy the whole accumulated text on every write.
+        self._parts: list[str] = []
+
+    @property
+    def text_output(self) -> str:
+        """
+        The concatenated output, one line per written item.
+        """
+        if len(self._parts) > 1:
+            # Keep the joined text so reading it again doesn't redo the join
+            self._parts = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    @text_output.setter
+    def text_output(self, value: str):
+        self._parts = [value] if value else []
 
     def write(self, lineinfo: LineStreamItem):
         """
@@ -45,8 +61,8 @@ class ToString(OutputBase):
         Args:
             lineinfo (LineStreamItem): The LineInfo object to write.
         """
-        msg = lineinfo.data + '\n'
-        self.text_output += str(msg)
+        self._parts.append(lineinfo.data)
+        self._parts.append('\n')
 
     def __enter__(self):
         """
@@ -54,7 +70,7 @@ class ToString(OutputBase):
 
         Clears the text_output to ensure it starts fresh when entering the context.
         """
-        self.text_output = ""
+        self._parts = []
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -26,7 +26,7 @@ from ._logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class LineStreamItem(StreamItem):
     """
     Represents a single line of text read from a (typically) a file in a pipeline.
@@ -45,7 +45,7 @@ class LineStreamItem(StreamItem):
             raise ValueError(msg)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ImageStreamItem(StreamItem):
     """
     Represents an image within a data pipeline.
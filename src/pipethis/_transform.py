@@ -16,6 +16,10 @@ Available Transformations:
 - `SkipRepeatedBlankLines`: Skips consecutive blank lines while keeping the first blank line.
 
 
+Transformations that change line data (`UpperCase`, `LowerCase`, `AddMetaData` and
+`RegexSubstituteTransform`) update the item in place and yield it, rather than allocating a
+new `LineStreamItem` for every line.
+
 Use Cases:
 These transformations are intended for use in text processing pipelines, enabling flexible
 manipulation of data streams that consist of individual lines of text.
@@ -59,30 +63,24 @@ class UpperCase(TransformBase):
     """A transform that converts line data to uppercase."""
 
     def transform(self, item: LineStreamItem) -> Iterable[LineStreamItem]:
-        yield LineStreamItem(sequence_id=item.sequence_id,
-                             resource_name=item.resource_name,
-                             data=item.data.upper())
+        item.data = item.data.upper()
+        yield item
 
 
 class LowerCase(TransformBase):
     """A transform that converts line data to lowercase."""
 
     def transform(self, item: LineStreamItem) -> Iterable[LineStreamItem]:
-        yield LineStreamItem(sequence_id=item.sequence_id,
-                             resource_name=item.resource_name,
-                             data=item.data.lower())
+        item.data = item.data.lower()
+        yield item
 
 
 class AddMetaData(TransformBase):
     """A transform that appends metadata to line data."""
 
     def transform(self, item: LineStreamItem) -> Iterable[LineStreamItem]:
-        new_data = f"{item.resource_name}:{item.sequence_id}:{item.data}"
-        yield LineStreamItem(
-            sequence_id=item.sequence_id,
-            resource_name=item.resource_name,
-            data=new_data
-        )
+        item.data = f"{item.resource_name}:{item.sequence_id}:{item.data}"
+        yield item
 
 
 class RegexSkipFilter(TransformBase):
@@ -90,9 +88,10 @@ class RegexSkipFilter(TransformBase):
 
     def __init__(self, pattern: str):
         self.regex = re.compile(pattern)
+        self._match = self.regex.match  # Bound once, called for every line
 
     def transform(self, item: LineStreamItem) -> Iterable[LineStreamItem]:
-        if not self.regex.match(item.data):
+        if not self._match(item.data):
             yield item
 
 
@@ -101,9 +100,10 @@ class RegexKeepFilter(TransformBase):
 
     def __init__(self, pattern: str):
         self.regex = re.compile(pattern)
+        self._match = self.regex.match  # Bound once, called for every line
 
     def transform(self, item: LineStreamItem) -> Iterable[LineStreamItem]:
-        if self.regex.match(item.data):
+        if self._match(item.data):
             yield item
 
 
@@ -113,9 +113,10 @@ class RegexSubstituteTransform(TransformBase):
     def __init__(self, pattern: str, replacement: str):
         self.regex = re.compile(pattern)
         self.replacement = replacement
+        self._sub = self.regex.sub  # Bound once, called for every line
 
     def transform(self, item: LineStreamItem) -> Iterable[LineStreamItem]:
-        item.data = self.regex.sub(self.replacement, item.data)
+        item.data = self._sub(self.replacement, item.data)
         yield item
 
 
@@ -126,11 +127,10 @@ class SkipRepeatedBlankLines(TransformBase):
         self.last_was_blank = False
 
     def transform(self, item: LineStreamItem) -> Iterable[LineStreamItem]:
-        is_blank = not item.data.strip()
-        if is_blank:
-            if not self.last_was_blank:
-                self.last_was_blank = True
-                yield item
-        else:
-            self.last_was_blank = False
+        # isspace() avoids building a stripped copy of every non-blank line
+        data = item.data
+        is_blank = not data or data.isspace()
+        emit = not (is_blank and self.last_was_blank)
+        self.last_was_blank = is_blank
+        if emit:
             yield item
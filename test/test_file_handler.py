@@ -1,5 +1,6 @@
 import pathlib
 import pytest
+from hypothesis import given, settings, strategies as st
 from pipethis import TextFileHandler, LineStreamItem  # Adjust import paths as necessary
 
 
@@ -86,3 +87,79 @@ def test_text_file_handler_non_existent_file(tmp_path: pathlib.Path):
         with TextFileHandler(non_existent_file) as handler:
             # Attempting to stream should never occur, as the exception should be raised earlier
             pass # pragma no cover
+
+
+@settings(max_examples=300)
+@given(text=st.text(alphabet="ab\r\né", max_size=40))
+def test_text_file_handler_mmap_matches_text_mode(tmp_path_factory, text):
+    """Test that the memory mapped path yields exactly the lines of the text mode path."""
+    test_file = tmp_path_factory.mktemp("mmap") / "test.txt"
+    test_file.write_bytes(text.encode("utf-8"))
+
+    text_handler = TextFileHandler(test_file, use_mmap=False)
+    text_handler.SMALL_FILE_THRESHOLD = -1  # Force the streamed text mode path
+    with text_handler as handler:
+        expected = list(handler.stream())
+    with TextFileHandler(test_file, use_mmap=True) as handler:
+        actual = list(handler.stream())
+
+    assert actual == expected
+
+
+@settings(max_examples=300)
+@given(text=st.text(alphabet="ab\r\né", max_size=40))
+def test_text_file_handler_whole_read_matches_text_mode(tmp_path_factory, text):
+    """Test that reading a small file in one go yields exactly the lines of the text mode path."""
+    test_file = tmp_path_factory.mktemp("whole") / "test.txt"
+    test_file.write_bytes(text.encode("utf-8"))
+
+    text_handler = TextFileHandler(test_file, use_mmap=False)
+    text_handler.SMALL_FILE_THRESHOLD = -1  # Force the streamed text mode path
+    with text_handler as handler:
+        expected = list(handler.stream())
+    with TextFileHandler(test_file, use_mmap=False) as handler:
+        assert handler._read_whole
+        actual = list(handler.stream())
+
+    assert actual == expected
+
+
+def test_text_file_handler_mmap_auto_threshold(tmp_path: pathlib.Path, monkeypatch):
+    """Test that files over the threshold are memory mapped by default."""
+    test_file = tmp_path / "big.txt"
+    test_file.write_text("Line 1\nLine 2\n")
+    monkeypatch.setattr(TextFileHandler, "MMAP_THRESHOLD", 4)
+
+    with TextFileHandler(test_file) as handler:
+        assert handler._mmap is not None
+        assert [item.data for item in handler.stream()] == ["Line 1", "Line 2"]
+
+
+def test_text_file_handler_mmap_requires_utf8(tmp_path: pathlib.Path):
+    """Test that forcing memory mapping with another encoding is rejected."""
+    test_file = tmp_path / "latin.txt"
+    test_file.write_text("Line 1", encoding="latin-1")
+
+    with pytest.raises(ValueError):
+        with TextFileHandler(test_file, encoding="latin-1", use_mmap=True):
+            pass  # pragma: no cover
+
+
+@pytest.mark.parametrize("use_mmap, small_file_threshold", [
+    (True, TextFileHandler.SMALL_FILE_THRESHOLD),  # Memory mapped
+    (False, TextFileHandler.SMALL_FILE_THRESHOLD),  # Read whole
+    (False, -1),  # Text mode
+])
+def test_text_file_handler_streams_once_per_context(tmp_path: pathlib.Path, use_mmap,
+                                                    small_file_threshold):
+    """Test that every read path streams the file once per context and again on re-entry."""
+    test_file = tmp_path / "test.txt"
+    test_file.write_text("Line 1\nLine 2\n")
+
+    handler = TextFileHandler(test_file, use_mmap=use_mmap)
+    handler.SMALL_FILE_THRESHOLD = small_file_threshold
+    with handler:
+        assert [item.data for item in handler.stream()] == ["Line 1", "Line 2"]
+        assert list(handler.stream()) == []
+    with handler:
+        assert [item.data for item in handler.stream()] == ["Line 1", "Line 2"]
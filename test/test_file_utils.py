@@ -0,0 +1,27 @@
+from fnmatch import fnmatch
+
+from hypothesis import given, strategies as st
+# noinspection PyProtectedMember
+from pipethis._file_utils import _compile_patterns, _make_name_filter
+
+
+def test_compiled_patterns_are_shared():
+    """Test that equal pattern sets reuse one compiled regex regardless of order."""
+    first = _compile_patterns(["*.txt", "*.log"])
+    second = _compile_patterns(["*.log", "*.txt", "*.log"])
+
+    assert first is second
+    assert first.match("a.log") and first.match("b.txt") and not first.match("c.tmp")
+    assert _compile_patterns([]) is None
+
+
+@given(
+    keep_patterns=st.lists(st.text(alphabet="*?.ab", min_size=1, max_size=5), max_size=3),
+    name=st.text(alphabet=".ab", max_size=6),
+)
+def test_name_filter_matches_fnmatch(keep_patterns, name):
+    """Test that the suffix shortcut and regex matching agree with fnmatch."""
+    name_filter = _make_name_filter(keep_patterns, [])
+    expected = not keep_patterns or any(fnmatch(name, pattern) for pattern in keep_patterns)
+
+    assert name_filter(name) == expected
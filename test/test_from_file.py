@@ -173,6 +173,40 @@ def test_from_file_empty_file(tmp_path):
         assert len(result) == 0
 
 
+def test_from_file_filepath_resolved_on_access(tmp_path, monkeypatch):
+    """Test that `filepath` is resolved lazily against the directory at construction time."""
+    monkeypatch.chdir(tmp_path)
+    from_file = FromFile("relative.txt")
+    monkeypatch.chdir(tmp_path.parent)
+
+    assert from_file.filepath == tmp_path.resolve() / "relative.txt"
+    assert from_file.filepath.is_absolute()
+
+
+def test_from_file_filepath_can_be_reassigned(tmp_path):
+    """Test that assigning `filepath` points the input, and its handler, at the new file."""
+    first = tmp_path / "first.txt"
+    first.write_text("first\n", encoding="utf-8")
+    second = tmp_path / "second.txt"
+    second.write_text("second\n", encoding="utf-8")
+
+    from_file = FromFile(first)
+    assert from_file.filepath == first.resolve()
+    from_file.filepath = second
+
+    assert from_file.filepath == second.resolve()
+    assert [item.data for item in from_file.stream()] == ["second"]
+
+
+def test_from_file_filepath_reassigned_keeps_explicit_handler(tmp_path):
+    """Test that an explicitly given handler survives a change of `filepath`."""
+    from_file = FromFile(tmp_path / "first.txt", handler=TextFileHandler)
+    from_file.filepath = tmp_path / "second.log"
+
+    assert isinstance(from_file.file_handler, TextFileHandler)
+    assert from_file.file_handler.file_path == (tmp_path / "second.log").resolve()
+
+
 def test_decorator_register_handler(tmp_path):
     """
     Test that the register_handler decorator correctly registers a handler for a file extension (.log)
@@ -198,10 +232,10 @@ def test_decorator_register_handler(tmp_path):
                 self._file.close()
 
         def stream(self):
-
+            resource_name = str(self.file_path)
             for idx, line in enumerate(self._file, start=1):
                 # Yield a LineStreamItem for each line
-                yield LineStreamItem(sequence_id=idx, resource_name=str(self.file_path), data=line.strip())
+                yield LineStreamItem(sequence_id=idx, resource_name=resource_name, data=line.strip())
 
     # Verify that the handler is now in the _HANDLER_MAP
     assert FromFile.get_registered_handler(".log") == LogFileHandler
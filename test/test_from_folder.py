@@ -1,4 +1,6 @@
+import os
 import pathlib
+
 import pytest
 # noinspection PyProtectedMember
 from pipethis._input_from_folder import FromFolder
@@ -6,11 +8,9 @@ from pipethis._input_from_folder import FromFolder
 from pipethis._file_handler import TextFileHandler
 
 
-# Pytest fixture to create temporary folder and files
-@pytest.fixture
-def folder_with_files(tmp_path):
-    """Creates a temporary folder with test files for FromFolder testing."""
-    folder = tmp_path / "test_folder"
+def create_test_folder(parent: pathlib.Path) -> pathlib.Path:
+    """Creates a folder with test files for FromFolder testing under `parent`."""
+    folder = parent / "test_folder"
     folder.mkdir()
 
     # This verifies that we don't dive into folders
@@ -33,6 +33,14 @@ def folder_with_files(tmp_path):
     # Return the folder path
     return folder
 
+
+# Pytest fixture to create temporary folder and files.  The tests only read the folder,
+# so it is built once per module; tests that modify it build their own.
+@pytest.fixture(scope="module")
+def folder_with_files(tmp_path_factory):
+    """Creates a temporary folder with test files for FromFolder testing."""
+    return create_test_folder(tmp_path_factory.mktemp("from_folder"))
+
 def test_from_folder_all_files(folder_with_files):
     """Test FromFolder streaming all files without relying on order."""
 
@@ -54,7 +62,7 @@ def test_from_folder_all_files(folder_with_files):
 
     # Check that all files and their lines are present (ignoring file iteration order)
     for line_info in results:
-        filename = pathlib.Path(line_info.resource_name).name
+        filename = os.path.basename(line_info.resource_name)
         assert filename in expected_lines
         # Verify line content matches one of the expected lines for this file
         assert line_info.data in expected_lines[filename]
@@ -85,6 +93,12 @@ def test_from_folder_all_files(folder_with_files):
 
         # Case 7: No filters applied - all files included
         (None, None, {"file1.txt", "file2.log", "file3.txt", "file4.tmp"}),
+
+        # Case 8: Character classes and single character wildcards
+        (["file[13].*", "file?.log"], None, {"file1.txt", "file2.log", "file3.txt"}),
+
+        # Case 9: Several ignore patterns combined
+        (None, ["*.tmp", "file[12].*"], {"file3.txt"}),
     ]
 )
 def test_folder_filtering(folder_with_files, keep_patterns, ignore_patterns, expected_files):
@@ -99,7 +113,7 @@ def test_folder_filtering(folder_with_files, keep_patterns, ignore_patterns, exp
         results = list(from_folder.stream())
 
     # Extract the filenames processed from results
-    processed_files = {pathlib.Path(line_info.resource_name).name for line_info in results}
+    processed_files = {os.path.basename(line_info.resource_name) for line_info in results}
 
     # Assert the filtered files match the expected result
     assert processed_files == expected_files
@@ -123,3 +137,79 @@ def test_from_folder_conflicting_filters(folder_with_files):
     with pytest.raises(ValueError, match="You can specify either keep_patterns or ignore_patterns, but not both."):
         FromFolder(folder_with_files, keep_patterns=[".txt"], ignore_patterns=[".log"])
 
+
+
+def test_from_folder_skips_linked_folders(tmp_path):
+    """Test that symlinks to folders are skipped just like folders."""
+    folder_with_files = create_test_folder(tmp_path)
+    try:
+        (folder_with_files / "linked_folder").symlink_to(folder_with_files / "empty_folder",
+                                                         target_is_directory=True)
+    except OSError:
+        pytest.skip("Symlinks are not supported on this platform")
+
+    results = FromFolder(folder_path=folder_with_files).to_list()
+
+    assert {os.path.basename(r.resource_name) for r in results} == {
+        "file1.txt", "file2.log", "file3.txt", "file4.tmp"}
+
+
+def test_from_folder_linked_root_is_resolved(tmp_path):
+    """Test that a folder reached through a symlink reports the resolved file paths."""
+    folder_with_files = create_test_folder(tmp_path)
+    try:
+        (tmp_path / "linked_root").symlink_to(folder_with_files, target_is_directory=True)
+    except OSError:
+        pytest.skip("Symlinks are not supported on this platform")
+
+    results = FromFolder(folder_path=tmp_path / "linked_root").to_list()
+
+    assert {os.path.dirname(r.resource_name) for r in results} == {
+        str(folder_with_files.resolve())}
+
+
+def test_from_folder_max_workers_matches_serial(folder_with_files):
+    """Test that reading ahead on worker threads keeps the serial output and order."""
+    serial = FromFolder(folder_path=folder_with_files).to_list()
+    threaded = FromFolder(folder_path=folder_with_files, max_workers=3).to_list()
+
+    assert threaded == serial
+
+
+def test_from_folder_max_workers_stop_early(folder_with_files):
+    """Test that a partially consumed threaded stream can be closed."""
+    stream = FromFolder(folder_path=folder_with_files, max_workers=2).stream()
+    first = next(stream)
+    stream.close()
+
+    assert first.sequence_id == 1
+
+
+@pytest.mark.parametrize("max_workers", [0, -1, 1.5, "2", True])
+def test_from_folder_invalid_max_workers(folder_with_files, max_workers):
+    """Test that max_workers must be a positive integer."""
+    with pytest.raises(ValueError):
+        FromFolder(folder_path=folder_with_files, max_workers=max_workers)
+
+
+def test_from_folder_entry_type_error_is_not_fatal(folder_with_files):
+    """Test that an entry whose type can't be read is treated as a file, not an error."""
+    class BrokenEntry:
+        name = "broken.txt"
+
+        def is_dir(self):
+            raise OSError("stale mount")
+
+    from_folder = FromFolder(folder_path=folder_with_files)
+
+    assert from_folder._should_include(BrokenEntry(), lambda name: True)
+
+
+def test_from_folder_patterns_changed_after_init(folder_with_files):
+    """Test that changing the patterns after construction is honoured by the next stream."""
+    from_folder = FromFolder(folder_path=folder_with_files, keep_patterns="*.txt")
+    from_folder.keep_patterns = ["*.log"]
+
+    results = from_folder.to_list()
+
+    assert {os.path.basename(r.resource_name) for r in results} == {"file2.log"}
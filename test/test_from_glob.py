@@ -1,3 +1,4 @@
+import os
 import pathlib
 from tempfile import TemporaryDirectory
 import pytest
@@ -13,21 +14,25 @@ def create_file(file_path: pathlib.Path, content: str = ""):
     file_path.write_text(content)
 
 from tempfile import TemporaryDirectory
-@pytest.fixture
-def setup_files() -> pathlib.Path:
-    """Fixture to set up a temporary folder structure for testing."""
-    with TemporaryDirectory() as temp_dir:
-        root = pathlib.Path(temp_dir)
+def create_tree(root: pathlib.Path) -> pathlib.Path:
+    """Helper function to create the folder structure used for testing under `root`."""
+    create_file(root / "file1.txt", "File 1, Line 1\nFile 1, Line 2")
+    create_file(root / "file2.log", "File 2, Line 1")
+    create_file(root / "folder1" / "file3.txt", "File 3, Line 1\nFile 3, Line 2")
+    create_file(root / "folder1" / "file4.tmp", "File 4, Line 1")
+    create_file(root / "ignored_folder" / "file5.txt", "File 5, Line 1")
+    create_file(root / "ignored_folder" / "file6.log", "File 6, Line 1")
+    return root
+
 
-        # Create files and folders
-        create_file(root / "file1.txt", "File 1, Line 1\nFile 1, Line 2")
-        create_file(root / "file2.log", "File 2, Line 1")
-        create_file(root / "folder1" / "file3.txt", "File 3, Line 1\nFile 3, Line 2")
-        create_file(root / "folder1" / "file4.tmp", "File 4, Line 1")
-        create_file(root / "ignored_folder" / "file5.txt", "File 5, Line 1")
-        create_file(root / "ignored_folder" / "file6.log", "File 6, Line 1")
+@pytest.fixture(scope="module")
+def setup_files(tmp_path_factory) -> pathlib.Path:
+    """Fixture to set up a temporary folder structure for testing.
 
-        yield root
+    The tests only read the tree, so it is built once per module; tests that modify it
+    build their own with `create_tree`.
+    """
+    return create_tree(tmp_path_factory.mktemp("from_glob"))
 
 
 def test_from_glob_all_files(setup_files):
@@ -38,7 +43,7 @@ def test_from_glob_all_files(setup_files):
 
     # Check that all file lines are included
     expected_files = {"file1.txt", "file2.log", "file3.txt", "file4.tmp", "file5.txt", "file6.log"}
-    actual_files = {pathlib.Path(result.resource_name).name for result in results}
+    actual_files = {os.path.basename(result.resource_name) for result in results}
     assert expected_files == actual_files
     assert len(results) == 8
 
@@ -49,7 +54,7 @@ def test_from_glob_keep_extensions(setup_files):
 
     # Check that only .txt file lines are included
     expected_files = {"file1.txt", "file3.txt", "file5.txt"}
-    actual_files = {pathlib.Path(result.resource_name).name for result in results}
+    actual_files = {os.path.basename(result.resource_name) for result in results}
     assert len(results) == 5  # 2 lines from each .txt file
     assert expected_files == actual_files
 
@@ -60,7 +65,7 @@ def test_from_glob_ignore_extensions(setup_files):
 
     # Check that .log and .tmp files are excluded
     expected_files = {"file1.txt", "file3.txt", "file5.txt"}
-    actual_files = {pathlib.Path(result.resource_name).name for result in results}
+    actual_files = {os.path.basename(result.resource_name) for result in results}
     assert len(results) == 5  # 2 lines from each non-ignored file
     assert expected_files == actual_files
 
@@ -89,7 +94,7 @@ def test_from_glob_ignore_folders(setup_files):
     # Check that files from "ignored_folder" are excluded
     expected_files = ["file1.txt", "file2.log", "file3.txt", "file4.tmp"]
     assert len(results) == 6  # Total lines from non-ignored folders
-    assert all(pathlib.Path(line_info.resource_name).name in expected_files for line_info in results)
+    assert all(os.path.basename(line_info.resource_name) in expected_files for line_info in results)
 
 def test_from_glob_keep_extensions_and_ignore_folders(setup_files):
     """Test FromGlob with both keep_patterns and ignore_folders."""
@@ -99,7 +104,7 @@ def test_from_glob_keep_extensions_and_ignore_folders(setup_files):
     # Check that .txt files in "ignored_folder" are excluded
     expected_files = ["file1.txt", "file3.txt"]
     assert len(results) == 4  # 2 lines from each included file
-    assert all(pathlib.Path(line_info.resource_name).name in expected_files for line_info in results)
+    assert all(os.path.basename(line_info.resource_name) in expected_files for line_info in results)
 
 def test_from_glob_invalid_folder_path():
     """Test that a ValueError is raised when the folder path is invalid."""
@@ -115,3 +120,155 @@ def test_fromglob_missing_file_handler_in_enter():
     with pytest.raises(ValueError, match=f"Glob folder_path {folder_path} does not exist."):
         from_glob = FromGlob(folder_path)
 
+
+
+@pytest.mark.parametrize(
+    "keep_patterns, expected_files",
+    [
+        # Only the literal folder is walked
+        (["folder1/*.txt"], {"file3.txt"}),
+        # Overlapping prefixes must not yield the same file twice
+        (["folder1/*", "folder1/*.txt"], {"file3.txt", "file4.tmp"}),
+        # Prefixed and un-prefixed patterns can be mixed
+        (["ignored_folder/*.log", "file1.txt"], {"file1.txt", "file6.log"}),
+        # A prefix that does not exist matches nothing
+        (["missing/*.txt"], set()),
+    ],
+)
+def test_from_glob_keep_patterns_with_folder_prefix(setup_files, keep_patterns, expected_files):
+    """Test FromGlob keep patterns that start with literal folder names."""
+    results = FromGlob(folder_path=setup_files, keep_patterns=keep_patterns).to_list()
+
+    actual_files = [os.path.basename(result.resource_name) for result in results]
+    assert set(actual_files) == expected_files
+    # Every matched file contributes each of its lines exactly once
+    assert len(results) == len({(r.resource_name, r.sequence_id) for r in results})
+
+
+def test_from_glob_prefix_inside_ignored_folder(setup_files):
+    """Test that a keep prefix does not bypass `ignore_folders`."""
+    from_glob = FromGlob(folder_path=setup_files,
+                         keep_patterns=["ignored_folder/*.txt"],
+                         ignore_folders=["ignored_folder"])
+    assert from_glob.to_list() == []
+
+
+def test_from_glob_relative_folder_gives_absolute_names(setup_files, monkeypatch):
+    """Test that a relative folder still produces absolute resource names."""
+    monkeypatch.chdir(setup_files)
+    results = FromGlob(folder_path="folder1", keep_patterns=["*.txt"]).to_list()
+
+    assert [r.data for r in results] == ["File 3, Line 1", "File 3, Line 2"]
+    assert all(pathlib.Path(r.resource_name).is_absolute() for r in results)
+
+
+def test_from_glob_max_workers_matches_serial(setup_files):
+    """Test that reading ahead on worker threads keeps the serial output and order."""
+    serial = FromGlob(folder_path=setup_files).to_list()
+    threaded = FromGlob(folder_path=setup_files, max_workers=4).to_list()
+
+    assert threaded == serial
+
+
+@pytest.mark.parametrize("max_workers", [0, 1.5, True, False])
+def test_from_glob_invalid_max_workers(setup_files, max_workers):
+    """Test that max_workers must be a positive integer, and not a bool."""
+    with pytest.raises(ValueError):
+        FromGlob(folder_path=setup_files, max_workers=max_workers)
+
+
+def test_from_glob_walk_order_matches_os_walk(setup_files):
+    """Test that files are visited in the same order as a top-down os.walk."""
+    expected = [os.path.join(root, file)
+                for root, _, files in os.walk(setup_files) for file in files]
+
+    from_glob = FromGlob(folder_path=setup_files)
+    actual = [str(path) for path in from_glob._iter_files()]
+
+    assert actual == expected
+
+
+def test_from_glob_linked_root_is_resolved(tmp_path):
+    """Test that a folder reached through a symlink reports the resolved file paths."""
+    setup_files = create_tree(tmp_path / "tree")
+    try:
+        (tmp_path / "linked_root").symlink_to(setup_files, target_is_directory=True)
+    except OSError:
+        pytest.skip("Symlinks are not supported on this platform")
+
+    results = FromGlob(folder_path=tmp_path / "linked_root").to_list()
+
+    root = str(setup_files.resolve())
+    assert results
+    assert all(r.resource_name.startswith(root + os.sep) for r in results)
+
+
+def test_from_glob_does_not_follow_linked_folders(tmp_path):
+    """Test that symlinks to folders are neither streamed nor descended into."""
+    setup_files = create_tree(tmp_path)
+    try:
+        (setup_files / "linked_folder").symlink_to(setup_files / "folder1",
+                                                   target_is_directory=True)
+    except OSError:
+        pytest.skip("Symlinks are not supported on this platform")
+
+    results = FromGlob(folder_path=setup_files, keep_patterns=["*.txt"]).to_list()
+
+    assert {os.path.basename(r.resource_name) for r in results} == {
+        "file1.txt", "file3.txt", "file5.txt"}
+    assert len(results) == 5
+
+
+@pytest.mark.parametrize(
+    "ignore_folders, expected_files",
+    [
+        (["ignored*"], {"file1.txt", "file2.log", "file3.txt", "file4.tmp"}),
+        (["folder?"], {"file1.txt", "file2.log", "file5.txt", "file6.log"}),
+        (["folder1", "ign[aeiou]red_*"], {"file1.txt", "file2.log"}),
+    ],
+)
+def test_from_glob_ignore_folder_patterns(setup_files, ignore_folders, expected_files):
+    """Test that ignore_folders accepts glob patterns as well as plain names."""
+    results = FromGlob(folder_path=setup_files, ignore_folders=ignore_folders).to_list()
+
+    assert {os.path.basename(r.resource_name) for r in results} == expected_files
+
+
+def test_from_glob_ignore_folders_stays_a_list(setup_files):
+    """Test that the public ignore_folders attribute keeps the list it was given."""
+    from_glob = FromGlob(folder_path=setup_files, ignore_folders="ignored_folder folder1")
+
+    assert from_glob.ignore_folders == ["ignored_folder", "folder1"]
+
+
+def test_from_glob_ignore_folders_changed_after_init(setup_files):
+    """Test that changing ignore_folders after construction is honoured by the next walk."""
+    from_glob = FromGlob(folder_path=setup_files)
+    from_glob.ignore_folders = ["ignored_folder"]
+
+    results = from_glob.to_list()
+
+    assert {os.path.basename(r.resource_name) for r in results} == {
+        "file1.txt", "file2.log", "file3.txt", "file4.tmp"}
+
+
+def test_from_glob_patterns_changed_after_init(setup_files):
+    """Test that changing keep_patterns and ignore_patterns after construction is honoured."""
+    from_glob = FromGlob(folder_path=setup_files, keep_patterns=["*.txt"])
+    from_glob.keep_patterns = ["*.log", "*.tmp"]
+    from_glob.ignore_patterns = ["*.tmp"]
+
+    results = from_glob.to_list()
+
+    assert {os.path.basename(r.resource_name) for r in results} == {"file2.log", "file6.log"}
+
+
+def test_from_glob_ignore_folder_literal_name_with_glob_chars(tmp_path):
+    """Test that a folder whose name contains glob characters is ignored by its exact name."""
+    create_file(tmp_path / "keep.txt", "kept")
+    create_file(tmp_path / "[old]" / "skip.txt", "skipped")
+    create_file(tmp_path / "o" / "other.txt", "skipped")  # Also matched by the glob [old]
+
+    results = FromGlob(folder_path=tmp_path, ignore_folders=["[old]"]).to_list()
+
+    assert {os.path.basename(r.resource_name) for r in results} == {"keep.txt"}
@@ -1,4 +1,4 @@
-
+import pytest
 
 
 from pipethis._input_from_string import FromString
@@ -39,3 +39,9 @@ def test_from_string_comma_separator():
     assert results[1].data == "line2"
     assert results[2].sequence_id == 3
     assert results[2].data == "line3"
+
+
+def test_from_string_empty_separator():
+    """Test that an empty separator is rejected just like `str.split`."""
+    with pytest.raises(ValueError):
+        list(FromString("abc", sep="").stream())
@@ -1,4 +1,5 @@
 from pipethis._input_from_string import FromString  # Adjust to your module's structure
+from pipethis import _input_from_string
 from hypothesis import given, strategies as st
 
 
@@ -24,4 +25,18 @@ def test_from_string_basic():
 
     assert results[3].sequence_id == 4
     assert results[3].resource_name == "text"
-    assert results[3].data == "Line 4"
\ No newline at end of file
+    assert results[3].data == "Line 4"
+
+@given(text=st.text(alphabet="ab,\n", max_size=40), sep=st.sampled_from(["\n", ",", "ab"]))
+def test_from_string_lazy_split_matches_str_split(text, sep):
+    """Test that the lazy split used for long texts yields the same chunks as `str.split`."""
+    original = _input_from_string._SPLIT_ALL_MAX
+    _input_from_string._SPLIT_ALL_MAX = -1  # Force the lazy path for every text
+    try:
+        results = [item.data for item in FromString(text, sep=sep).stream()]
+        raw = list(_input_from_string._iter_split(text, sep))
+    finally:
+        _input_from_string._SPLIT_ALL_MAX = original
+
+    assert results == text.split(sep)
+    assert raw == text.split(sep)
@@ -1,6 +1,7 @@
 import pytest
 from pipethis._input_from_string import FromString
 from pipethis._input_from_strings import FromStrings
+from pipethis._streamitem import LineStreamItem
 
 def test_from_string_empty_input():
     """Test `FromString` with an empty string."""
@@ -82,4 +83,24 @@ def test_from_strings_single_string_input():
     from_strings_instance = FromStrings(lines=single_line)
 
     # Assert the lines are correctly wrapped into a list
-    assert from_strings_instance.lines == [single_line]
\ No newline at end of file
+    assert from_strings_instance.lines == [single_line]
+
+def test_from_strings_stream_batched():
+    """Test that `stream_batched` yields one (resource_name, chunks) tuple per input string."""
+    from_strings = FromStrings(["A-B-C", "D"], sep="-", name="batch")
+    results = list(from_strings.stream_batched())
+
+    assert results == [("batch-1", ["A", "B", "C"]), ("batch-2", ["D"])]
+
+    # The batched form carries the same data as the item-at-a-time stream
+    flattened = [(name, chunk) for name, chunks in results for chunk in chunks]
+    assert flattened == [(item.resource_name, item.data) for item in from_strings.stream()]
+
+
+def test_from_strings_stream_raw():
+    """Test that `stream_raw` yields plain tuples matching the `LineStreamItem` fields."""
+    from_strings = FromStrings(["A-B", "C"], sep="-", name="raw")
+    results = list(from_strings.stream_raw())
+
+    assert results == [(1, "raw-1", "A"), (2, "raw-1", "B"), (1, "raw-2", "C")]
+    assert [LineStreamItem(*item) for item in results] == from_strings.to_list()
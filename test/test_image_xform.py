@@ -1,5 +1,5 @@
 import pytest
-from PIL import Image, ImageEnhance
+from PIL import Image
 # noinspection PyProtectedMember
 from pipethis._image_transform import ImageEnhancerTransformer, ImageStreamItem
 
@@ -54,23 +54,22 @@ def stream_item_gradient(colorful_gradient_image):
 # ---------------------------
 
 def calculate_brightness(color, brightness_factor):
-    """Mathematically calculate brightness-adjusted RGB values."""
+    """Mathematically calculate brightness-adjusted channel values (a pixel or a whole image)."""
     return tuple(min(255, max(0, int(c * brightness_factor))) for c in color)
 
 
-def calculate_contrast(color, contrast_factor):
+def calculate_contrast(image, contrast_factor):
     """
-    Recreate PIL's ImageEnhance.Contrast logic and apply it to a single pixel value.
-    """
-    # Create a dummy 1x1 image with the provided color
-    dummy_image = Image.new("RGB", (1, 1), color=color)
-    enhancer = ImageEnhance.Contrast(dummy_image)
-
-    # Apply the contrast adjustment
-    adjusted_image = enhancer.enhance(contrast_factor)
+    Mathematically calculate contrast-adjusted channel values for a whole RGB image.
 
-    # Return the adjusted pixel as a tuple
-    return adjusted_image.getpixel((0, 0))
+    Contrast pivots around the mean grey level (ITU-R 601 luma) of the whole image:
+    each channel value c becomes mean + factor * (c - mean), clipped to 0..255.
+    """
+    channels = image.tobytes()
+    pixels = [channels[i:i + 3] for i in range(0, len(channels), 3)]
+    grey = [0.299 * r + 0.587 * g + 0.114 * b for r, g, b in pixels]
+    mean = int(sum(grey) / len(grey) + 0.5)
+    return [min(255, max(0, round(mean + contrast_factor * (c - mean)))) for c in channels]
 
 
 
@@ -99,11 +98,11 @@ def test_brightness_calculation(stream_item_solid):
     assert transformed_item.data.mode == "RGB", f"Expected RGB mode, got {transformed_item.data.mode}"
 
     # Validate every pixel matches the mathematical transformation: R, G, B = R*1.5, G*1.5, B*1.5
-    original_pixels = list(stream_item_solid.data.getdata())  # Original pixels from fixture
-    transformed_pixels = list(transformed_item.data.getdata())  # Pixels after transformation
+    # Raw channel bytes are compared directly rather than building a tuple per pixel.
+    original_bytes = stream_item_solid.data.tobytes()  # Original pixels from fixture
+    transformed_bytes = transformed_item.data.tobytes()  # Pixels after transformation
 
-    for original, transformed in zip(original_pixels, transformed_pixels):
-        assert transformed == calculate_brightness(original, 1.5)
+    assert transformed_bytes == bytes(calculate_brightness(original_bytes, 1.5))
 
 
 # Test Contrast Adjustment with Mathematical Precision
@@ -112,11 +111,22 @@ def test_contrast_calculation(stream_item_solid):
     transformed_item = transformer.transform(stream_item_solid)
 
     # Validate every pixel matches the expected adjustment
-    original_pixels = list(stream_item_solid.data.getdata())
-    transformed_pixels = list(transformed_item.data.getdata())
+    # PIL blends in single precision, so allow the last digit to round either way
+    expected = calculate_contrast(stream_item_solid.data, 1.2)
+    actual = transformed_item.data.tobytes()
+    assert len(actual) == len(expected)
+    assert all(abs(a - e) <= 1 for a, e in zip(actual, expected))
+
+
+def test_contrast_calculation_gradient(stream_item_gradient):
+    transformer = ImageEnhancerTransformer(contrast=1.5)
+    transformed_item = transformer.transform(stream_item_gradient)
 
-    for original, transformed in zip(original_pixels, transformed_pixels):
-        assert transformed == calculate_contrast(original, 1.2)
+    # The pivot is the mean of the whole image, not of each pixel
+    expected = calculate_contrast(stream_item_gradient.data, 1.5)
+    actual = transformed_item.data.tobytes()
+    assert len(actual) == len(expected)
+    assert all(abs(a - e) <= 1 for a, e in zip(actual, expected))
 
 
 # Test Saturation Adjustment (Color Enhancer)
@@ -18,3 +18,9 @@ def test_image_stream_item_validate_invalid_data():
     # Expect a ValueError with a specific message
     with pytest.raises(ValueError):
         _ = ImageStreamItem(sequence_id=2, resource_name="invalid_image", data="not_an_image")
+
+
+def test_image_stream_item_is_slotted():
+    """Test that ImageStreamItem instances don't carry a per-instance __dict__."""
+    item = ImageStreamItem(sequence_id=1, resource_name="image.png", data=Image.new("RGB", (1, 1)))
+    assert not hasattr(item, "__dict__")
@@ -3,6 +3,7 @@ import pathlib
 # noinspection PyProtectedMember
 from pipethis._input_from_string import FromString
 from pipethis._input_from_folder import FromFolder
+from pipethis._input_from_glob import FromGlob
 from pipethis._input_from_file import FromFile
 from pipethis._input_from_strings import FromStrings
 from pipethis._base import InputBase
@@ -187,3 +188,23 @@ def test_from_strings_context_manager_and_iteration():
 
 
 
+
+def test_input_iteration_matches_stream():
+    """Iterating an input directly yields the same items as its `stream` method."""
+    from_strings = FromStrings(["a b", "c"], sep=" ", name="iter")
+
+    assert [item for item in from_strings] == list(from_strings.stream())
+    assert list(FromString("x,y", sep=",")) == FromString("x,y", sep=",").to_list()
+
+
+def test_builtin_inputs_have_no_instance_dict(tmp_path):
+    """Test that the built-in inputs are fully slotted."""
+    inputs = [
+        FromString("a"),
+        FromStrings(["a"]),
+        FromFile(tmp_path / "file.txt"),
+        FromFolder(tmp_path),
+        FromGlob(tmp_path),
+    ]
+    for input_ in inputs:
+        assert not hasattr(input_, "__dict__"), type(input_).__name__
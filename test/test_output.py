@@ -84,6 +84,75 @@ def test_file_output(tmp_path, lines):
     assert content == expected_output
 
 
+
+def test_file_output_flushes_in_blocks(tmp_path, monkeypatch):
+    """
+    Test that ToFile writes buffered blocks as they fill up and the remainder on close.
+    """
+    monkeypatch.setattr(ToFile, "BUFFER_SIZE", 10)
+    file_path = tmp_path / "output.txt"
+    lines = [LineStreamItem(i, "test", f"line {i}") for i in range(1, 6)]
+
+    with ToFile(file_name=str(file_path)) as output:
+        output.write(lines[0])
+        output.write(lines[1])
+        # The first two lines fill the buffer and have been handed to the file
+        output.file.flush()
+        assert file_path.read_text(encoding="utf-8") == "line 1\nline 2\n"
+        for lineinfo in lines[2:]:
+            output.write(lineinfo)
+
+    assert file_path.read_text(encoding="utf-8") == "".join(f"line {i}\n" for i in range(1, 6))
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "ascii", "latin-1", "utf-8-sig", "utf-16"])
+def test_file_output_encodings(tmp_path, monkeypatch, encoding):
+    """
+    Test that ToFile output decodes back to the written lines for several encodings,
+    including ones with a BOM that must only be written once.
+    """
+    monkeypatch.setattr(ToFile, "BUFFER_SIZE", 8)
+    file_path = tmp_path / "output.txt"
+    data = ["caf\u00e9", "plain", "na\u00efve"] if encoding != "ascii" else ["a", "b", "c"]
+
+    with ToFile(file_name=str(file_path), encoding=encoding) as output:
+        for i, text in enumerate(data, start=1):
+            output.write(LineStreamItem(i, "test", text))
+
+    assert file_path.read_text(encoding=encoding) == "".join(f"{text}\n" for text in data)
+
+
+@pytest.mark.parametrize("encoding", ["ascii", "cp437"])  # Binary and text mode paths
+def test_file_output_encoding_error_at_write(tmp_path, encoding):
+    """
+    Test that an unencodable line fails at its write, earlier lines reach the file and the
+    file is closed.
+    """
+    file_path = tmp_path / "output.txt"
+    output = ToFile(file_name=str(file_path), encoding=encoding)
+
+    with pytest.raises(UnicodeEncodeError):
+        with output:
+            output.write(LineStreamItem(1, "test", "ok line"))
+            output.write(LineStreamItem(2, "test", "100 \u20ac"))
+            output.write(LineStreamItem(3, "test", "never written"))  # pragma: no cover
+
+    assert output.file is None
+    assert file_path.read_text(encoding=encoding) == "ok line\n"
+
+
+def test_file_output_append_mode(tmp_path):
+    """
+    Test that ToFile appends to an existing file in 'a' mode.
+    """
+    file_path = tmp_path / "output.txt"
+    file_path.write_text("existing\n", encoding="utf-8")
+
+    with ToFile(file_name=str(file_path), mode="a") as output:
+        output.write(LineStreamItem(1, "test", "appended"))
+
+    assert file_path.read_text(encoding="utf-8") == "existing\nappended\n"
+
 @pytest.mark.parametrize(
     "pattern, item, is_yielded",
     [
@@ -210,6 +279,22 @@ def test_to_string_context_manager():
         expected_output = "First line\nSecond line\n"
         assert to_string.text_output == expected_output
 
+
+
+def test_to_string_write_after_read():
+    """Test that text_output stays correct when reads and writes are interleaved."""
+    to_string = ToString()
+    to_string.write(LineStreamItem(1, "a", "one"))
+    assert to_string.text_output == "one\n"
+
+    to_string.write(LineStreamItem(2, "a", "two"))
+    assert to_string.text_output == "one\ntwo\n"
+    assert to_string.text_output == "one\ntwo\n"
+
+    to_string.text_output = ""
+    to_string.write(LineStreamItem(3, "a", "three"))
+    assert to_string.text_output == "three\n"
+
 # Assuming ToStdOut is implemented and overrides `write`
 # noinspection SpellCheckingInspection
 def test_to_stdout_context_manager(capsys):
@@ -233,3 +318,23 @@ def test_to_stdout_context_manager(capsys):
 
     # Assert the captured stdout matches the expected output
     assert captured.out == expected_output
+
+
+def test_to_stdout_buffers_only_inside_context(capsys, monkeypatch):
+    """
+    Test that ToStdOut writes immediately outside a context and in batches inside one.
+    """
+    monkeypatch.setattr(ToStdOut, "BUFFER_LINES", 2)
+    to_stdout = ToStdOut()
+
+    to_stdout.write(LineStreamItem(1, "a", "direct"))
+    assert capsys.readouterr().out == "direct\n"
+
+    with to_stdout:
+        to_stdout.write(LineStreamItem(1, "a", "one"))
+        assert capsys.readouterr().out == ""
+        to_stdout.write(LineStreamItem(2, "a", "two"))
+        assert capsys.readouterr().out == "one\ntwo\n"
+        to_stdout.write(LineStreamItem(3, "a", "three"))
+
+    assert capsys.readouterr().out == "three\n"
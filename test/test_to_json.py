@@ -3,6 +3,7 @@ import json
 import datetime as dt
 from pipethis._output_to_json import ToJson
 from pipethis._input_from_string import FromString
+from pipethis._streamitem import LineStreamItem
 
 def test_to_json_with_string_input(tmp_path):
     file_name = tmp_path / "test.json"
@@ -127,3 +128,87 @@ def test_to_json_with_string_run_date(tmp_path):
     assert json_data['records'][0]['data'] == "Date as string test"
     assert json_data['records'][0]['resource_name'] == "date_string_test"
     assert json_data['records'][0]['sequence_id'] == 1
+
+def test_to_json_streams_many_records(tmp_path):
+    file_name = tmp_path / "many.json"
+
+    lines = [f"line {i}" for i in range(1, 1001)]
+    pipeline = FromString("\n".join(lines), sep='\n', name='many') | ToJson(file_name=file_name)
+    pipeline.run()
+
+    json_data = json.loads(file_name.read_text())
+    assert json_data['header']['count'] == 1000
+    assert [record['data'] for record in json_data['records']] == lines
+    assert [record['sequence_id'] for record in json_data['records']] == list(range(1, 1001))
+
+def test_to_json_close_is_idempotent(tmp_path):
+    file_name = tmp_path / "twice.json"
+
+    with ToJson(file_name=file_name) as output:
+        output.close()
+    # __exit__ closes again, which must not rewrite or corrupt the file
+    json_data = json.loads(file_name.read_text())
+    assert json_data['header']['count'] == 0
+    assert json_data['records'] == []
+
+def test_to_json_write_after_close_raises(tmp_path):
+    file_name = tmp_path / "closed.json"
+
+    output = ToJson(file_name=file_name)
+    with output:
+        output.write(LineStreamItem(1, "text", "kept"))
+    with pytest.raises(ValueError):
+        output.write(LineStreamItem(2, "text", "lost"))
+
+    # The file written before closing is untouched
+    json_data = json.loads(file_name.read_text())
+    assert json_data['header']['count'] == 1
+    assert json_data['records'][0]['data'] == "kept"
+
+def test_to_json_keeps_records(tmp_path):
+    file_name = tmp_path / "kept.json"
+
+    with ToJson(file_name=file_name, keep_records=True) as output:
+        output.write(LineStreamItem(1, "text", "line 1"))
+        output.write(LineStreamItem(2, "text", "line 2"))
+
+    assert [record['data'] for record in output.records] == ["line 1", "line 2"]
+    assert output.json_data == json.loads(file_name.read_text())
+
+def test_to_json_reenter_rewrites_kept_records(tmp_path):
+    file_name = tmp_path / "reenter.json"
+
+    output = ToJson(file_name=file_name, keep_records=True)
+    with output:
+        output.write(LineStreamItem(1, "text", "first"))
+    with output:
+        output.write(LineStreamItem(1, "text", "second"))
+
+    json_data = json.loads(file_name.read_text())
+    assert json_data['header']['count'] == 2
+    assert [record['data'] for record in json_data['records']] == ["first", "second"]
+
+def test_to_json_streams_without_keeping_records(tmp_path):
+    file_name = tmp_path / "streamed.json"
+
+    output = ToJson(file_name=file_name)
+    with output:
+        output.write(LineStreamItem(1, "text", "line 1"))
+
+    assert output.records == []
+    json_data = json.loads(file_name.read_text())
+    assert json_data['header']['count'] == 1
+    assert json_data['records'][0]['data'] == "line 1"
+
+def test_to_json_header_attributes(tmp_path):
+    file_name = tmp_path / "header.json"
+
+    output = ToJson(file_name=file_name, description="Before", run_date="2023-11-05T15:30:45")
+    assert output.description == "Before"
+    assert output.run_date == "2023-11-05T15:30:45"
+    output.description = "After"
+    output.close()
+
+    json_data = json.loads(file_name.read_text())
+    assert json_data['header'] == {'description': "After", 'date': "2023-11-05T15:30:45",
+                                   'count': 0}
@@ -133,6 +133,20 @@ def test_add_metadata_transform(item, expected_line):
                     LineStreamItem(sequence_id=6, resource_name="ResourceA", data=""),
                 ],
         ),
+        # Case 6: Whitespace-only lines count as blank
+        (
+                [
+                    LineStreamItem(sequence_id=1, resource_name="ResourceA", data="First line"),
+                    LineStreamItem(sequence_id=2, resource_name="ResourceA", data="  "),
+                    LineStreamItem(sequence_id=3, resource_name="ResourceA", data="\t"),
+                    LineStreamItem(sequence_id=4, resource_name="ResourceA", data=" x "),
+                ],
+                [
+                    LineStreamItem(sequence_id=1, resource_name="ResourceA", data="First line"),
+                    LineStreamItem(sequence_id=2, resource_name="ResourceA", data="  "),
+                    LineStreamItem(sequence_id=4, resource_name="ResourceA", data=" x "),
+                ],
+        ),
     ],
 )
 def test_skip_repeated_blank_lines(input_lines, expected_output_lines):
@@ -190,3 +204,16 @@ def test_pass_through_multiple():
         assert transformed.data == original.data
         assert transformed.sequence_id == original.sequence_id
         assert transformed.resource_name == original.resource_name
+
+
+@pytest.mark.parametrize("transform", [UpperCase(), LowerCase(), AddMetaData()])
+def test_data_transforms_update_item_in_place(transform):
+    """
+    Test that the data transforms yield the item they were given rather than a copy.
+    """
+    item = LineStreamItem(sequence_id=4, resource_name="ResourceD", data="Mixed Case")
+    transformed = list(transform.transform(item))
+
+    assert transformed == [item]
+    assert transformed[0] is item
+    assert item.sequence_id == 4 and item.resource_name == "ResourceD"